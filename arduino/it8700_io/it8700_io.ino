@@ -0,0 +1,86 @@
+// Firmware of the Arduino switching the input sources of the IT8700 test fixture.
+//
+// Serial protocol, every frame ends with '\n'. An unterminated frame only ends after SERIAL_FRAME_TIMEOUT ms without
+// new bytes, so frames sent back to back without the terminator would be read as a single one.
+//   M{mode}{pin}          pinMode(), mode: I = INPUT, O = OUTPUT, P = INPUT_PULLUP
+//   WD{pin}:{value}       digitalWrite() of a single pin
+//   RD{pin}               digitalRead(), answers "D{pin}:{value}"
+//   WP{mask}:{break_ms}   writes every output pin at once, pin N taking bit N of mask. The pins being turned off
+//                         are cleared first and the pins being turned on are only set break_ms later
+//                         (break-before-make), answering "P:{mask}" with the resulting outputs.
+
+const uint8_t OUTPUT_PINS[] = {4, 5, 6, 7, 8, 9, 10};
+const uint8_t OUTPUT_PINS_COUNT = sizeof(OUTPUT_PINS) / sizeof(OUTPUT_PINS[0]);
+const unsigned long SERIAL_FRAME_TIMEOUT = 5;
+const unsigned int MAX_BREAK_TIME = 5000;
+
+void setup() {
+  Serial.begin(9600);
+  Serial.setTimeout(SERIAL_FRAME_TIMEOUT);
+  for (uint8_t i = 0; i < OUTPUT_PINS_COUNT; i++) {
+    pinMode(OUTPUT_PINS[i], OUTPUT);
+    digitalWrite(OUTPUT_PINS[i], LOW);
+  }
+}
+
+unsigned long readOutputsMask() {
+  unsigned long mask = 0;
+  for (uint8_t i = 0; i < OUTPUT_PINS_COUNT; i++) {
+    if (digitalRead(OUTPUT_PINS[i]) == HIGH) {
+      mask |= 1UL << OUTPUT_PINS[i];
+    }
+  }
+  return mask;
+}
+
+void writePins(unsigned long mask, unsigned int breakTime) {
+  bool making = false;
+  for (uint8_t i = 0; i < OUTPUT_PINS_COUNT; i++) {
+    uint8_t pin = OUTPUT_PINS[i];
+    bool target = mask & (1UL << pin);
+    if (!target) {
+      digitalWrite(pin, LOW);
+    } else if (digitalRead(pin) == LOW) {
+      making = true;
+    }
+  }
+  if (making && breakTime > 0) {
+    delay(min(breakTime, MAX_BREAK_TIME));
+  }
+  for (uint8_t i = 0; i < OUTPUT_PINS_COUNT; i++) {
+    if (mask & (1UL << OUTPUT_PINS[i])) {
+      digitalWrite(OUTPUT_PINS[i], HIGH);
+    }
+  }
+  Serial.print("P:");
+  Serial.println(readOutputsMask());
+}
+
+void handleFrame(String frame) {
+  frame.trim();
+  if (frame.startsWith("WP")) {
+    int separator = frame.indexOf(':');
+    unsigned long mask = strtoul(frame.substring(2, separator).c_str(), NULL, 10);
+    unsigned int breakTime = separator > 0 ? frame.substring(separator + 1).toInt() : 0;
+    writePins(mask, breakTime);
+  } else if (frame.startsWith("WD")) {
+    int separator = frame.indexOf(':');
+    digitalWrite(frame.substring(2, separator).toInt(), frame.substring(separator + 1).toInt() ? HIGH : LOW);
+  } else if (frame.startsWith("RD")) {
+    int pin = frame.substring(2).toInt();
+    Serial.print("D");
+    Serial.print(pin);
+    Serial.print(":");
+    Serial.println(digitalRead(pin));
+  } else if (frame.startsWith("M") && frame.length() > 2) {
+    char mode = frame.charAt(1);
+    int pin = frame.substring(2).toInt();
+    pinMode(pin, mode == 'O' ? OUTPUT : mode == 'P' ? INPUT_PULLUP : INPUT);
+  }
+}
+
+void loop() {
+  if (Serial.available() > 0) {
+    handleFrame(Serial.readStringUntil('\n'));
+  }
+}
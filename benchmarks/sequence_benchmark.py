@@ -0,0 +1,185 @@
+"""
+Headless benchmark of complete test sequences against the simulated IT8700 and Arduino.
+
+Run from the repository root:
+    python -m benchmarks.sequence_benchmark [test_file.yaml ...] [--latency 5] [--runs 3]
+
+Every run is appended to the results file. The mean sequence time of each test file is compared with the previous
+stored runs of the same file and latency, and the command exits with status 1 when it regressed beyond the tolerance.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from statistics import mean
+from time import perf_counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yaml
+from PySide6.QtCore import QObject, QTimer, QEventLoop
+from PySide6.QtWidgets import QApplication
+
+from controllers.connection_pool import connection_pool
+from controllers.test_controller import TestController, TestState
+from models.test_file_model import TestData
+from utils.config_manager import ConfigManager
+from utils.constants import ARDUINO_BULK_WRITE, SIMULATION_ENABLED, SIMULATION_LATENCY, TEST_FILES_DIR, STEP_TYPES_MAP
+
+DEFAULT_TEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_test.yaml")
+DEFAULT_RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+PROBE_INTERVAL = 5
+STALL_THRESHOLD = 0.02
+RUN_TIMEOUT = 600000
+
+
+class EventLoopProbe(QObject):
+    """Measures how late a short periodic timer fires, i.e. how long the GUI event loop was blocked."""
+
+    def __init__(self):
+        super().__init__()
+        self.timer = QTimer(self)
+        self.timer.setInterval(PROBE_INTERVAL)
+        self.timer.timeout.connect(self._on_tick)
+        self.last_tick = 0.0
+        self.total_stall = 0.0
+        self.max_stall = 0.0
+
+    def start(self) -> None:
+        self.last_tick = perf_counter()
+        self.timer.start()
+
+    def stop(self) -> None:
+        self.timer.stop()
+
+    def _on_tick(self) -> None:
+        now = perf_counter()
+        lateness = now - self.last_tick - PROBE_INTERVAL / 1000
+        self.last_tick = now
+        if lateness > STALL_THRESHOLD:
+            self.total_stall += lateness
+            self.max_stall = max(self.max_stall, lateness)
+
+
+def load_test_data(file_path: str) -> TestData:
+    with open(file_path, "r", encoding="utf-8") as file:
+        return TestData(**yaml.safe_load(file))
+
+
+def run_sequence(test_data: TestData) -> dict:
+    """Runs the whole [test_data] sequence once and returns its measurements."""
+    controller = TestController(test_data)
+    controller.serial_number = "1".zfill(8)
+    # The instrument sessions are pooled across runs, so only the traffic of this run is counted.
+    load = controller.electronic_load_controller.inst_resource
+    arduino = controller.arduino_controller.arduino.conn
+    load_counters = (load.transactions, load.bytes_written, load.bytes_read)
+    arduino_counters = (arduino.transactions, arduino.bytes_written)
+    probe = EventLoopProbe()
+    loop = QEventLoop()
+    controller.state_changed.connect(
+        lambda _: loop.quit() if controller.state in [TestState.PASSED, TestState.FAILED] else None)
+    QTimer.singleShot(RUN_TIMEOUT, loop.quit)
+
+    started = perf_counter()
+    probe.start()
+    controller.start_test_sequence()
+    loop.exec()
+    total_time = perf_counter() - started
+    probe.stop()
+
+    steps = controller.get_sequence_steps()
+    step_times: dict[str, float] = {}
+    for timing in controller.step_engine.step_timings:
+        step_name = STEP_TYPES_MAP.get(steps[timing.index].step_type)
+        step_times[step_name] = step_times.get(step_name, 0.0) + timing.duration
+
+    result = {
+        "result": controller.state.value,
+        "total_time": total_time,
+        "step_times": step_times,
+        "step_overhead": sum(timing.overhead for timing in controller.step_engine.step_timings),
+        "load_transactions": load.transactions - load_counters[0],
+        "load_bytes_written": load.bytes_written - load_counters[1],
+        "load_bytes_read": load.bytes_read - load_counters[2],
+        "arduino_transactions": arduino.transactions - arduino_counters[0],
+        "arduino_bytes_written": arduino.bytes_written - arduino_counters[1],
+        "total_stall": probe.total_stall,
+        "max_stall": probe.max_stall,
+    }
+    controller.close()
+    return result
+
+
+def read_history(results_file: str, test_file: str, latency: int) -> list[dict]:
+    if not os.path.exists(results_file):
+        return []
+    with open(results_file, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file if line.strip()]
+    return [record for record in records if record["test_file"] == test_file and record["latency"] == latency]
+
+
+def print_run(run: dict) -> None:
+    steps = ", ".join(f"{name}: {value:.2f}s" for name, value in run["step_times"].items())
+    print(f"  [{run['result']}] {run['total_time']:.2f}s ({steps}) | overhead {run['step_overhead'] * 1000:.1f}ms | "
+          f"load {run['load_transactions']} tx {run['load_bytes_written'] + run['load_bytes_read']} B | "
+          f"arduino {run['arduino_transactions']} tx | stall {run['total_stall'] * 1000:.0f}ms "
+          f"(max {run['max_stall'] * 1000:.0f}ms)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks test sequences against the simulated instruments.")
+    parser.add_argument("test_files", nargs="*", default=[DEFAULT_TEST_FILE])
+    parser.add_argument("--latency", type=int, default=5, help="simulated serial latency per transaction (ms)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--results", default=DEFAULT_RESULTS_FILE, help="JSON lines file storing every run")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown before failing (ratio)")
+    parser.add_argument("--no-store", action="store_true", help="do not append the runs to the results file")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    output_dir = tempfile.mkdtemp(prefix="it8700_bench_")
+    ConfigManager.override(SIMULATION_ENABLED, True)
+    ConfigManager.override(SIMULATION_LATENCY, args.latency)
+    # The simulated Arduino implements the WP command of the firmware in arduino/.
+    ConfigManager.override(ARDUINO_BULK_WRITE, True)
+    ConfigManager.override(TEST_FILES_DIR, output_dir)
+
+    regressions = []
+    for test_file in args.test_files:
+        test_data = load_test_data(test_file)
+        os.makedirs(os.path.join(output_dir, test_data.group), exist_ok=True)
+        test_name = os.path.basename(test_file)
+        history = read_history(args.results, test_name, args.latency)
+
+        print(f"{test_name} @ {args.latency}ms latency")
+        runs = []
+        for _ in range(args.runs):
+            run = run_sequence(test_data)
+            print_run(run)
+            runs.append(run)
+
+        mean_time = mean(run["total_time"] for run in runs)
+        print(f"  mean {mean_time:.2f}s per unit, {3600 / mean_time:.0f} units/h")
+        if history:
+            reference = mean(record["total_time"] for record in history)
+            if mean_time > reference * (1 + args.tolerance):
+                regressions.append(test_name)
+                print(f"  REGRESSION: {mean_time:.2f}s vs {reference:.2f}s stored mean")
+
+        if not args.no_store:
+            date = datetime.now().isoformat(timespec="seconds")
+            with open(args.results, "a", encoding="utf-8") as file:
+                for run in runs:
+                    file.write(json.dumps({"date": date, "test_file": test_name, "latency": args.latency, **run}) + "\n")
+
+    connection_pool.close_all()
+    app.quit()
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
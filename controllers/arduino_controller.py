@@ -1,71 +1,188 @@
-from time import sleep
+from time import monotonic
 
-import pyvisa
+from PySide6.QtCore import QTimer
+from serial import SerialException
 
+from models.station_profile_model import StationProfile
 from utils.arduino_interface import Arduino
 from utils.config_manager import ConfigManager
-from utils.constants import ARDUINO_RESOURCE_PATH, ARDUINO_OUTPUT_PINS
+from utils.constants import ARDUINO_OUTPUT_PINS, SIMULATION_ENABLED, ARDUINO_BUZZER_PIN, ARDUINO_BULK_WRITE, \
+    ARDUINO_BREAK_TIME, ARDUINO_BUZZER_PULSE_TIME
+from utils.instrument_simulator import SimulatedArduinoSerial, get_simulation_latency
+from utils.visa_resources import list_resources
+
+INPUT_SOURCE_PINS: dict[tuple[int, str], int] = {
+    (0, "CA"): 4,
+    (1, "CA"): 5,
+    (2, "CA"): 6,
+    (0, "CC"): 7,
+    (1, "CC"): 8,
+    (2, "CC"): 9,
+}
 
 
 class ArduinoController:
-    def __init__(self):
+    def __init__(self, station: StationProfile | None = None):
         self.config = ConfigManager()
-        self.rm = pyvisa.ResourceManager("@py")
+        self.station = station if station is not None else self.config.get_default_station_profile()
         self.arduino = None
 
-        arduino_path = self.config.get(ARDUINO_RESOURCE_PATH)
-        resources = self.rm.list_resources()
-        if arduino_path in resources:
-            self.arduino = Arduino()
+        if self.config.get_bool(SIMULATION_ENABLED):
+            self.arduino = Arduino(SimulatedArduinoSerial(get_simulation_latency(self.config)))
+        else:
+            self.arduino = self._open_arduino()
 
         self.output_pins_state = {pin: False for pin in ARDUINO_OUTPUT_PINS}
         self.active_pin = 0
+        # Cleared for the session if the firmware does not acknowledge the [WP] frame.
+        self.bulk_write_supported = self.config.get_bool(ARDUINO_BULK_WRITE)
+        self.break_time = 0
+        self.relay_settle_times: dict[int, int] = {}
+        self.applied_pins_mask = 0
+        self.buzzing = False
+        self.settle_deadline = 0.0
+        self.make_settle_time = 0.0
+        # Sets the pins of the [WD] fallback once the break after clearing the previous ones has elapsed.
+        self.make_timer = QTimer()
+        self.make_timer.setSingleShot(True)
+        self.make_timer.timeout.connect(self._make_pins)
+        self.restore_defaults()
+
+    def restore_defaults(self) -> None:
+        """
+        Restores the configured relay timings and switches every output off, discarding the pins left by a previous
+        user of the session (e.g. the pin test of the settings window).
+        """
+        self.break_time = int(self.config.get(ARDUINO_BREAK_TIME))
+        self.relay_settle_times = self.config.get_relay_settle_times()
+        self.output_pins_state = {pin: False for pin in ARDUINO_OUTPUT_PINS}
+        self.active_pin = 0
+        if self.applied_pins_mask:
+            self.setup_active_pin(True)
+
+    def _open_arduino(self) -> Arduino | None:
+        """Opens the serial port directly, checking the (cached) discovery to retry once only if that fails."""
+        try:
+            return Arduino(port=self.station.arduino_serial_port)
+        except (SerialException, OSError):
+            pass
+        if self.station.arduino_resource_path not in list_resources():
+            return None
+        try:
+            return Arduino(port=self.station.arduino_serial_port)
+        except (SerialException, OSError):
+            return None
 
     def check_connection(self) -> bool:
         """Checks the connection status with the Arduino."""
         return self.arduino is not None
 
+    def check_session(self) -> bool:
+        """Checks that the Arduino still answers, reading back the buzzer pin."""
+        if not self.check_connection():
+            return False
+        try:
+            return self.arduino.digital_read(ARDUINO_BUZZER_PIN) is not None
+        except (SerialException, OSError, ValueError):
+            return False
+
+    def close(self) -> None:
+        """Closes the serial connection."""
+        self.make_timer.stop()
+        if self.arduino is not None:
+            self.arduino.close()
+            self.arduino = None
+
     def setup_active_pin(self, reset: bool) -> None:
-        """Activates the selected arduino pin or [reset]."""
+        """
+        Activates the selected arduino pin or [reset], without waiting for the relays: the [settle_deadline] is
+        moved by the settle time of the slowest relay that changed, after the break on the [WD] fallback.
+        """
         if not self.check_connection():
             return
 
-        for pin, state in self.output_pins_state.items():
-            if reset:
-                self.arduino.digital_write(pin, 0)
-            else:
-                self.arduino.digital_write(pin, 1 if state else 0)
-        sleep(1)
+        pins_mask = 0 if reset else sum(1 << pin for pin, state in self.output_pins_state.items() if state)
+        if self.buzzing:
+            pins_mask |= 1 << ARDUINO_BUZZER_PIN
+        # A pending make pass would set the pins of a superseded mask.
+        self.make_timer.stop()
+        if self.bulk_write_supported and not self.arduino.write_pins(pins_mask, self.break_time):
+            self.bulk_write_supported = False
+        if not self.bulk_write_supported:
+            # Break-before-make: every pin being turned off is cleared now, the new pins [break_time] ms later.
+            for pin in self.output_pins_state:
+                if not pins_mask >> pin & 1:
+                    self.arduino.digital_write(pin, 0)
+            if pins_mask:
+                self.make_timer.start(self.break_time)
+
+        changed_pins = [pin for pin in self.output_pins_state if (self.applied_pins_mask ^ pins_mask) >> pin & 1]
+        settle_time = max((self.relay_settle_times.get(pin, 0) for pin in changed_pins), default=0) / 1000
+        # With the [WD] fallback the new relays only close after the break, when [_make_pins()] restarts the wait.
+        making = self.make_timer.isActive()
+        self.make_settle_time = settle_time if making else 0.0
+        if changed_pins:
+            break_time = self.break_time / 1000 if making else 0.0
+            self.settle_deadline = max(self.settle_deadline, monotonic() + break_time + settle_time)
+        self.applied_pins_mask = pins_mask
+
+    def _make_pins(self) -> None:
+        """
+        Sets the pins of [applied_pins_mask], the make pass of the [WD] fallback, moving the [settle_deadline] to
+        the settle time of the relays counted from now.
+        """
+        if not self.check_connection():
+            return
+        for pin in self.output_pins_state:
+            # The buzzer pulse may have ended during the break.
+            if self.applied_pins_mask >> pin & 1 and (pin != ARDUINO_BUZZER_PIN or self.buzzing):
+                self.arduino.digital_write(pin, 1)
+        self.settle_deadline = max(self.settle_deadline, monotonic() + self.make_settle_time)
+
+    def get_settle_deadline(self) -> float:
+        """Returns the monotonic time after which the last relay change has settled."""
+        return self.settle_deadline
+
+    def get_remaining_settle_time(self) -> float:
+        """Returns the seconds left until the relays settle, 0 if already settled."""
+        return max(0.0, self.settle_deadline - monotonic())
 
     def set_input_source(self, input_source: int, input_type: str) -> None:
-        """Sets the active output pin relative to [pin_mapping]."""
-        pin_mapping = {
-            (0, "CA"): 4,
-            (1, "CA"): 5,
-            (2, "CA"): 6,
-            (0, "CC"): 7,
-            (1, "CC"): 8,
-            (2, "CC"): 9,
-        }
-
-        if (input_source, input_type) in pin_mapping:
-            self.change_output(pin_mapping[(input_source, input_type)])
+        """Sets the active output pin relative to [INPUT_SOURCE_PINS]."""
+        if (input_source, input_type) in INPUT_SOURCE_PINS:
+            self.change_output(INPUT_SOURCE_PINS[(input_source, input_type)])
+
+    def get_input_source(self, input_type: str) -> int | None:
+        """Returns the input source of [input_type] currently switched on, None if no source is active."""
+        return next((source for (source, source_type), pin in INPUT_SOURCE_PINS.items()
+                     if source_type == input_type and pin == self.active_pin), None)
+
+    def get_input_source_settle_time(self, input_source: int, input_type: str) -> float:
+        """Returns the relay settle time (s) of switching to [input_source]."""
+        return self.relay_settle_times.get(INPUT_SOURCE_PINS.get((input_source, input_type)), 0) / 1000
 
     def change_output(self, active_pin: int) -> None:
-        """Updates all output pins state."""
+        """
+        Updates all output pins state, the previous pin being opened before the new one is closed.
+        """
         if not self.check_connection() or self.active_pin == active_pin:
             return
 
         self.active_pin = active_pin
-        self.setup_active_pin(True)
         self.output_pins_state.update({pin: pin == active_pin for pin in self.output_pins_state})
         self.setup_active_pin(False)
 
     def buzzer(self) -> None:
-        """Activates the buzzer alert."""
+        """Activates the buzzer alert for [ARDUINO_BUZZER_PULSE_TIME] ms."""
         if not self.check_connection():
             return
 
-        self.arduino.digital_write(10, 1)
-        sleep(0.5)
-        self.arduino.digital_write(10, 0)
+        self.buzzing = True
+        self.arduino.digital_write(ARDUINO_BUZZER_PIN, 1)
+        QTimer.singleShot(ARDUINO_BUZZER_PULSE_TIME, self._stop_buzzer)
+
+    def _stop_buzzer(self) -> None:
+        """Ends the buzzer pulse, scheduled by [buzzer()] instead of blocking the sequence."""
+        self.buzzing = False
+        if self.check_connection():
+            self.arduino.digital_write(ARDUINO_BUZZER_PIN, 0)
@@ -0,0 +1,136 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from time import monotonic
+
+from controllers.electronic_load_controller import ElectronicLoadController
+from models.channel_sample_model import ChannelSample
+from models.test_file_model import Param
+from utils.current_limit_search import create_current_limit_search
+
+
+class ChannelRunner(ABC):
+    """State machine of a single channel inside a step. It is advanced by every acquisition scan."""
+
+    def __init__(self, electronic_load_controller: ElectronicLoadController, channel_id: int, param_id: int,
+                 params: Param):
+        self.electronic_load_controller = electronic_load_controller
+        self.channel_id = channel_id
+        self.param_id = param_id
+        self.params = params
+        self.done = False
+
+    @abstractmethod
+    def update(self, sample: ChannelSample | None) -> None:
+        """Advances the channel with the [sample] of the latest scan, None if the channel was not read."""
+
+    def _is_settled(self, sample: ChannelSample | None) -> bool:
+        """Checks if [sample] was acquired after the last load change on the channel settled."""
+        if sample is None or not self.electronic_load_controller.is_channel_settled(self.channel_id):
+            return False
+        return sample.timestamp >= self.electronic_load_controller.get_settle_deadline(self.channel_id)
+
+
+class CurrentLimitingChannelRunner(ChannelRunner):
+    """Feeds each settled reading to the limit search and applies the next load until the limit is found."""
+
+    def __init__(self, electronic_load_controller: ElectronicLoadController, channel_id: int, param_id: int,
+                 params: Param, strategy: str, resolution: float):
+        super().__init__(electronic_load_controller, channel_id, param_id, params)
+        self.search = create_current_limit_search(strategy, params.ia, params.ib, resolution)
+        self.limit = 0.0
+        self.started = False
+        self.recovering = False
+        self.limit_found = False
+
+    def update(self, sample: ChannelSample | None) -> None:
+        if not self.started:
+            self.started = True
+            self._set_load(self.search.load)
+            return
+        if not self._is_settled(sample):
+            return
+
+        voltage_read = sample.voltage
+        if self.limit_found:
+            self.done = voltage_read > self.params.va
+        elif self.recovering:
+            if voltage_read >= self.params.va:
+                self.recovering = False
+                self._set_load(self.search.load)
+        else:
+            voltage_ok = voltage_read >= self.params.va
+            next_load = self.search.next_load(voltage_ok)
+            if next_load is None:
+                self.limit = self.search.limit
+                self.limit_found = True
+                self._set_load(self.params.ia)
+            elif not voltage_ok:
+                self.recovering = True
+                self._set_load(self.params.ia)
+            else:
+                self._set_load(next_load)
+
+    def _set_load(self, load: float) -> None:
+        self.electronic_load_controller.set_channel_current(self.channel_id, load)
+
+
+class ShortTestState(Enum):
+    LOADING = 0
+    SHORTING = 1
+    RECOVERING = 2
+    FINISHING = 3
+
+
+class ShortTestChannelRunner(ChannelRunner):
+    """
+    Shorts the channel as soon as the static load settles and releases it on the first sample below the shutdown
+    threshold, then waits for the output to recover. Each phase gives up after [timeout] seconds.
+    """
+
+    def __init__(self, electronic_load_controller: ElectronicLoadController, channel_id: int, param_id: int,
+                 params: Param, timeout: float):
+        super().__init__(electronic_load_controller, channel_id, param_id, params)
+        self.timeout = timeout
+        self.shutdown = False
+        self.recovery = False
+        self.shutdown_time: float | None = None
+        self.recovery_time: float | None = None
+        self.state: ShortTestState | None = None
+        self.phase_start = 0.0
+
+    def update(self, sample: ChannelSample | None) -> None:
+        if self.state is None:
+            self.electronic_load_controller.set_channel_current(self.channel_id, self.params.ia)
+            self._enter(ShortTestState.LOADING)
+            return
+        if sample is None or sample.timestamp < self.phase_start:
+            return
+
+        elapsed = sample.timestamp - self.phase_start
+        match self.state:
+            case ShortTestState.LOADING:
+                if self._is_settled(sample):
+                    self.electronic_load_controller.toggle_short_mode(self.channel_id, True)
+                    self._enter(ShortTestState.SHORTING)
+            case ShortTestState.SHORTING:
+                if sample.voltage <= self.params.va * 0.2:
+                    self.shutdown = True
+                    self.shutdown_time = elapsed
+                if self.shutdown or elapsed >= self.timeout:
+                    self.electronic_load_controller.toggle_short_mode(self.channel_id, False)
+                    self._enter(ShortTestState.RECOVERING if self.shutdown else ShortTestState.FINISHING)
+            case ShortTestState.RECOVERING:
+                if sample.voltage >= self.params.va:
+                    self.recovery = True
+                    self.recovery_time = elapsed
+                if self.recovery or elapsed >= self.timeout:
+                    self._enter(ShortTestState.FINISHING)
+            case ShortTestState.FINISHING:
+                self.done = self._is_settled(sample)
+
+    def _enter(self, state: ShortTestState) -> None:
+        """Moves to [state]. Only samples acquired after this point are considered by the new state."""
+        if state is ShortTestState.FINISHING:
+            self.electronic_load_controller.set_channel_current(self.channel_id, 0)
+        self.state = state
+        self.phase_start = monotonic()
@@ -0,0 +1,87 @@
+from PySide6.QtCore import QMutex, QMutexLocker
+
+from controllers.arduino_controller import ArduinoController
+from controllers.electronic_load_controller import ElectronicLoadController
+from models.station_profile_model import StationProfile
+from utils.config_manager import ConfigManager
+from utils.constants import SIMULATION_ENABLED
+
+
+class ConnectionPool:
+    """
+    Application-wide pool of the instrument sessions. A released [ElectronicLoadController] or [ArduinoController]
+    stays connected and is handed to the next test of the same station after a cheap health check, avoiding the
+    identification commands and the Arduino reset (bootloader) of a new connection.
+    """
+
+    def __init__(self):
+        self.mutex = QMutex()
+        self.idle_loads: dict[tuple, ElectronicLoadController] = {}
+        self.idle_arduinos: dict[tuple, ArduinoController] = {}
+
+    def acquire_load(self, station: StationProfile | None = None) -> ElectronicLoadController:
+        """Returns the idle load session of [station] if it is still healthy, else a new connection."""
+        config = ConfigManager()
+        station = station if station is not None else config.get_default_station_profile()
+        with QMutexLocker(self.mutex):
+            controller = self.idle_loads.pop(self._get_key(config, station, station.sat_resource_path), None)
+        if controller is not None:
+            if controller.check_session():
+                controller.restore_defaults()
+                return controller
+            controller.close()
+        return ElectronicLoadController(station)
+
+    def acquire_arduino(self, station: StationProfile | None = None) -> ArduinoController:
+        """Returns the idle Arduino session of [station] if it is still healthy, else a new connection."""
+        config = ConfigManager()
+        station = station if station is not None else config.get_default_station_profile()
+        with QMutexLocker(self.mutex):
+            controller = self.idle_arduinos.pop(self._get_key(config, station, station.arduino_serial_port), None)
+        if controller is not None:
+            if controller.check_session():
+                controller.restore_defaults()
+                return controller
+            controller.close()
+        return ArduinoController(station)
+
+    def release_load(self, controller: ElectronicLoadController) -> None:
+        """Keeps a connected [controller] for the next test, closing it if another session is already idle."""
+        if not controller.conn_status:
+            return
+        key = self._get_key(controller.config, controller.station, controller.station.sat_resource_path)
+        with QMutexLocker(self.mutex):
+            replaced = self.idle_loads.get(key)
+            self.idle_loads[key] = controller
+        if replaced is not None:
+            replaced.close()
+
+    def release_arduino(self, controller: ArduinoController) -> None:
+        """Keeps a connected [controller] for the next test, closing it if another session is already idle."""
+        if not controller.check_connection():
+            return
+        key = self._get_key(controller.config, controller.station, controller.station.arduino_serial_port)
+        with QMutexLocker(self.mutex):
+            replaced = self.idle_arduinos.get(key)
+            self.idle_arduinos[key] = controller
+        if replaced is not None:
+            replaced.close()
+
+    def close_all(self) -> None:
+        """Closes every idle session, e.g. on exit or after the connection settings changed."""
+        with QMutexLocker(self.mutex):
+            controllers = [*self.idle_loads.values(), *self.idle_arduinos.values()]
+            self.idle_loads.clear()
+            self.idle_arduinos.clear()
+        for controller in controllers:
+            controller.close()
+
+    @staticmethod
+    def _get_key(config: ConfigManager, station: StationProfile, resource: str) -> tuple:
+        """Sessions are shared by resource, except the simulated ones, which belong to their station."""
+        if config.get_bool(SIMULATION_ENABLED):
+            return "SIMULATED", station.name
+        return "RESOURCE", resource
+
+
+connection_pool = ConnectionPool()
@@ -1,26 +1,66 @@
-from time import sleep
+from concurrent.futures import Future
+from time import monotonic
 
-import pyvisa
+from PySide6.QtCore import QThreadPool
+from pyvisa import VisaIOError
 
+from models.station_profile_model import StationProfile
+from utils.command_queue import CommandQueue, CommandLane
 from utils.config_manager import ConfigManager
-from utils.constants import SAT_RESOURCE_PATH, SAT_BAUD_RATE
+from utils.constants import SAT_BAUD_RATE, SAT_SETTLE_TIME, SAT_SETTLE_MODE, SIMULATION_ENABLED, \
+    SAT_TIMEOUT, SAT_QUERY_RETRIES
+from utils.instrument_simulator import SimulatedIT8700, build_psu_model, get_simulation_latency
+from utils.visa_resources import open_resource
 from utils.scpi_commands import *
 
 
 class ElectronicLoadController:
-    def __init__(self):
+    def __init__(self, station: StationProfile | None = None):
         self.config = ConfigManager()
-        self.rm = pyvisa.ResourceManager("@py")
+        self.station = station if station is not None else self.config.get_default_station_profile()
         self.conn_status = False
         self.inst_id = ""
         self.inst_resource = self._setup_connection()
-        self.active_channel = 0
+        self.thread_pool = QThreadPool()
+        self.command_queue = None
+        self.settle_time = 0.0
+        self.settle_mode = ""
+        self.settle_deadlines: dict[int, float] = {}
+        self.pending_settles: dict[int, Future] = {}
+        self.restore_defaults()
+
+        if self.inst_resource is not None:
+            self.command_queue = CommandQueue(self.inst_resource, int(self.config.get(SAT_QUERY_RETRIES)))
+            self.thread_pool.start(self.command_queue)
+
+    def restore_defaults(self) -> None:
+        """Restores the configured settling, discarding the changes and state left by a previous test."""
+        self.settle_time = int(self.config.get(SAT_SETTLE_TIME)) / 1000
+        self.settle_mode = self.config.get(SAT_SETTLE_MODE)
+        self.settle_deadlines.clear()
+        self.pending_settles.clear()
+
+    def check_session(self) -> bool:
+        """Cheaply checks that the instrument still answers, with an operation complete query."""
+        if not self.conn_status or self.command_queue is None:
+            return False
+        try:
+            self._sat_query(OPERATION_COMPLETE).result(int(self.config.get(SAT_TIMEOUT)) / 1000)
+        except (VisaIOError, OSError, TimeoutError):
+            return False
+        return True
 
     def _setup_connection(self):
-        """Configures the connection with the SAT instrument."""
-        if self.config.get(SAT_RESOURCE_PATH) in self.rm.list_resources():
-            inst = self.rm.open_resource(self.config.get(SAT_RESOURCE_PATH))
+        """Configures the connection with the SAT instrument, or with its simulator if enabled."""
+        inst = None
+        if self.config.get_bool(SIMULATION_ENABLED):
+            inst = SimulatedIT8700(build_psu_model(self.config), get_simulation_latency(self.config))
+        else:
+            inst = open_resource(self.station.sat_resource_path)
+
+        if inst is not None:
             inst.baud_rate = self.config.get(SAT_BAUD_RATE)
+            inst.timeout = int(self.config.get(SAT_TIMEOUT))
             self.conn_status = True
             id_response = inst.query(INST_ID)
             self.inst_id = id_response.strip()
@@ -31,24 +71,17 @@ class ElectronicLoadController:
 
         return None
 
-    def _sat_write(self, command: str) -> None:
-        """Sends a write [command] to the instrument."""
-        self.inst_resource.write(command)
+    def _sat_write(self, command: str, channel_id: int | None = None) -> Future:
+        """Queues a write [command] to the instrument, selecting [channel_id] first if given."""
+        return self.command_queue.submit(command, channel_id)
 
-    def _sat_query(self, command: str) -> str:
+    def _sat_query(self, command: str, channel_id: int | None = None,
+                   lane: CommandLane = CommandLane.CONTROL) -> Future:
         """
-        Sends a query [command] to the instrument.
-        Returns the response string.
+        Queues a query [command] to the instrument, selecting [channel_id] first if given.
+        Returns a future with the response string.
         """
-        return self.inst_resource.query(command)
-
-    def _select_channel(self, channel_id: int) -> None:
-        """Set the [channel_id] as active on the instrument."""
-        if self.active_channel == channel_id:
-            return
-
-        self.active_channel = channel_id
-        self._sat_write(f"{SELECT_CHANNEL}{channel_id}")
+        return self.command_queue.submit(command, channel_id, True, lane)
 
     def toggle_active_channels_input(self, channels: list[int], state: bool) -> None:
         """Toggles the [channels] input to [status]."""
@@ -56,33 +89,80 @@ class ElectronicLoadController:
             return
 
         for channel in channels:
-            self._select_channel(channel)
-            self._sat_write(INPUT_ON if state else INPUT_OFF)
+            self._sat_write(INPUT_ON if state else INPUT_OFF, channel)
+
+    def request_channel_value(self, channel_id: int) -> Future | None:
+        """Queues a voltage reading of the instrument channel on the monitor lane."""
+        if not self.conn_status:
+            return None
+
+        return self._sat_query(FETCH_VOLT, channel_id, CommandLane.MONITOR)
 
     def get_channel_value(self, channel_id: int) -> str | None:
         """Query the instrument channel for the current voltage reading."""
-        if not self.conn_status:
+        future = self.request_channel_value(channel_id)
+        return future.result() if future else None
+
+    def request_channels_values(self, channel_ids: list[int]) -> Future | None:
+        """Queues a single compound query fetching the voltage and current of every channel in [channel_ids]."""
+        if not self.conn_status or not channel_ids:
             return None
 
-        self._select_channel(channel_id)
-        return self._sat_query(FETCH_VOLT)
+        queries = []
+        for channel_id in channel_ids:
+            queries.append((channel_id, FETCH_VOLT))
+            queries.append((channel_id, FETCH_CURR))
+        return self.command_queue.submit_batch(queries, CommandLane.MONITOR)
+
+    def get_channels_values(self, channel_ids: list[int]) -> dict[int, tuple[float, float]] | None:
+        """Returns the (voltage, current) reading of each channel in [channel_ids] using one transaction."""
+        future = self.request_channels_values(channel_ids)
+        if future is None:
+            return None
+
+        values = [float(value) for value in future.result()]
+        return {channel_id: (values[index * 2], values[index * 2 + 1]) for index, channel_id in enumerate(channel_ids)}
 
     def set_channel_current(self, channel_id: int, load: float) -> None:
         """Sets the current on the instrument active channel."""
         if not self.conn_status:
             return
 
-        self._select_channel(channel_id)
-        self._sat_write(f"{SET_CURR}{load}")
-        sleep(0.1)
+        self._sat_write(f"{SET_CURR}{load}", channel_id)
+        self._start_settle(channel_id)
+
+    def _start_settle(self, channel_id: int) -> None:
+        """
+        Starts the settling window of [channel_id] without blocking the caller.
+        In [opc] mode the window only ends after the instrument answers the operation complete query.
+        """
+        self.settle_deadlines[channel_id] = monotonic() + self.settle_time
+        if self.settle_mode == "opc":
+            future = self._sat_query(OPERATION_COMPLETE, channel_id)
+            future.add_done_callback(lambda _: self._extend_settle_deadline(channel_id))
+            self.pending_settles[channel_id] = future
+
+    def _extend_settle_deadline(self, channel_id: int) -> None:
+        """Moves the [channel_id] deadline to the operation complete time if it is later."""
+        self.settle_deadlines[channel_id] = max(self.settle_deadlines.get(channel_id, 0.0), monotonic())
+
+    def is_channel_settled(self, channel_id: int) -> bool:
+        """Checks if the last load change on [channel_id] has settled."""
+        future = self.pending_settles.get(channel_id)
+        if future is not None and not future.done():
+            return False
+        return monotonic() >= self.settle_deadlines.get(channel_id, 0.0)
+
+    def get_settle_deadline(self, channel_id: int) -> float:
+        """Returns the monotonic time after which [channel_id] readings reflect the last load change."""
+        return self.settle_deadlines.get(channel_id, 0.0)
 
     def toggle_short_mode(self, channel_id: int, state: bool) -> None:
         """Toggles the instrument [SHORT] mode."""
         if not self.conn_status:
             return
 
-        self._select_channel(channel_id)
-        self._sat_write(SHORT_ON if state else SHORT_OFF)
+        self._sat_write(SHORT_ON if state else SHORT_OFF, channel_id)
 
     def reset_instrument(self) -> None:
         """Sends the [RESET] command to the instrument."""
@@ -90,3 +170,14 @@ class ElectronicLoadController:
             return
 
         self._sat_write(RESET)
+
+    def close(self) -> None:
+        """Executes the pending commands and releases the instrument resource."""
+        if self.command_queue is None:
+            return
+
+        self.command_queue.stop()
+        self.thread_pool.waitForDone()
+        self.inst_resource.close()
+        self.command_queue = None
+        self.conn_status = False
@@ -0,0 +1,203 @@
+import multiprocessing
+import queue
+from multiprocessing.process import BaseProcess
+
+from PySide6.QtCore import QObject, Signal, QTimer, QCoreApplication, Slot
+
+from controllers.test_controller import TestController, TestState
+from models.station_profile_model import StationProfile
+from models.test_file_model import TestData
+from utils.config_manager import ConfigManager
+from utils.constants import IO_METRICS_ENABLED
+from utils.io_metrics import io_metrics
+from utils.sample_history import SampleHistory
+from utils.sample_ring import SampleRing
+from views.channel_monitor_view import ChannelMonitorView
+
+POLL_INTERVAL = 20
+CLOSE_TIMEOUT = 5
+# Signals of the station [TestController] forwarded to the GUI process as (name, args) events.
+FORWARDED_SIGNALS = ["state_changed", "serial_number_updated", "current_step_changed", "result_file_updated",
+                     "remaining_time_changed", "channel_limits_changed", "instrument_error", "step_order_changed",
+                     "recording_finished"]
+
+
+def run_station_process(test_data: TestData, station: StationProfile | None, overrides: dict, ring_name: str,
+                        commands: multiprocessing.Queue, events: multiprocessing.Queue) -> None:
+    """
+    Entry point of a station process: runs a headless [TestController] with its own event loop, applying the
+    [commands] sent by the [StationProcessController] and reporting its signals through [events] and its
+    samples through the shared [SampleRing].
+    """
+    app = QCoreApplication([])
+    for key, value in overrides.items():
+        ConfigManager.override(key, value)
+    io_metrics.enabled = ConfigManager().get_bool(IO_METRICS_ENABLED)
+    ring = SampleRing(ring_name)
+    controller = TestController(test_data, station)
+    controller.worker_signals.update_output.connect(ring.write)
+    for signal_name in FORWARDED_SIGNALS:
+        getattr(controller, signal_name).connect(
+            lambda *args, name=signal_name: events.put((name, args, controller.state.value)))
+
+    def apply_commands() -> None:
+        while True:
+            try:
+                command, args = commands.get_nowait()
+            except queue.Empty:
+                return
+            if command == "close":
+                controller.close()
+                app.quit()
+                return
+            if command == "set":
+                setattr(controller, *args)
+            else:
+                getattr(controller, command)(*args)
+
+    command_timer = QTimer()
+    command_timer.timeout.connect(apply_commands)
+    command_timer.start(POLL_INTERVAL)
+    app.exec()
+    ring.close()
+
+
+class StationProcessController(QObject):
+    """
+    Runs the sequencer and the instrument I/O of one station in a separate process, exposing the same signals,
+    slots and attributes the test views use from a [TestController].
+    A hung or crashed station process is reported through [instrument_error] without affecting other stations.
+    """
+    state_changed = Signal(str)
+    serial_number_updated = Signal(str)
+    current_step_changed = Signal(str, float, int)
+    result_file_updated = Signal(str)
+    remaining_time_changed = Signal(int)
+    channel_limits_changed = Signal(int, float, float)
+    instrument_error = Signal(str)
+    step_order_changed = Signal(str)
+    recording_finished = Signal(str)
+
+    def __init__(self, test_data: TestData, station: StationProfile | None = None):
+        super().__init__()
+        self.test_data = test_data
+        self.station = station
+        self.channel_list: list[ChannelMonitorView] = []
+        self.sample_history = SampleHistory(list(test_data.channels.keys()))
+        self.state = TestState.NONE
+        self._serial_number = ""
+        self._tester_id = ""
+        self._serial_number_needs_increment = False
+        self.closing = False
+
+        context = multiprocessing.get_context("spawn")
+        self.ring = SampleRing()
+        self.commands = context.Queue()
+        self.events = context.Queue()
+        self.process: BaseProcess = context.Process(
+            target=run_station_process, daemon=True,
+            args=(test_data, station, dict(ConfigManager.overrides), self.ring.name, self.commands, self.events))
+        self.process.start()
+
+        self.channel_limits_changed.connect(self._update_channel_limits)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self._poll_process)
+        self.poll_timer.start(POLL_INTERVAL)
+
+    @property
+    def serial_number(self) -> str:
+        return self._serial_number
+
+    @serial_number.setter
+    def serial_number(self, value: str) -> None:
+        self._serial_number = value
+        self._send("set", "serial_number", value)
+
+    @property
+    def tester_id(self) -> str:
+        return self._tester_id
+
+    @tester_id.setter
+    def tester_id(self, value: str) -> None:
+        self._tester_id = value
+        self._send("set", "tester_id", value)
+
+    @property
+    def serial_number_needs_increment(self) -> bool:
+        return self._serial_number_needs_increment
+
+    @serial_number_needs_increment.setter
+    def serial_number_needs_increment(self, value: bool) -> None:
+        self._serial_number_needs_increment = value
+        self._send("set", "serial_number_needs_increment", value)
+
+    @Slot()
+    def start_test_sequence(self) -> None:
+        self._send("start_test_sequence")
+
+    @Slot(int)
+    def setup_single_run(self, step_id: int) -> None:
+        self._send("setup_single_run", step_id)
+
+    @Slot()
+    def toggle_test_pause_state(self) -> None:
+        self._send("toggle_test_pause_state")
+
+    @Slot()
+    def continue_sequence(self) -> None:
+        self._send("continue_sequence")
+
+    @Slot()
+    def cancel_test_sequence(self) -> None:
+        self._send("cancel_test_sequence")
+
+    def close(self) -> None:
+        """Asks the station process to release its instruments, killing it if it does not exit in time."""
+        self.closing = True
+        self.poll_timer.stop()
+        self._send("close")
+        self.process.join(CLOSE_TIMEOUT)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.ring.close()
+
+    def _send(self, command: str, *args) -> None:
+        if self.process.is_alive():
+            self.commands.put((command, args))
+
+    @Slot()
+    def _poll_process(self) -> None:
+        """Re-emits the pending events of the station process and updates the channel views with its samples."""
+        while True:
+            try:
+                signal_name, args, state = self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.state = TestState(state)
+            if signal_name == "serial_number_updated":
+                self._serial_number = args[0]
+            getattr(self, signal_name).emit(*args)
+
+        samples = self.ring.read_new()
+        self.sample_history.append(samples)
+        for sample in samples:
+            channel_view = self._get_channel_view_by_id(sample.channel_id)
+            if channel_view:
+                channel_view.set_values((sample.voltage, sample.current))
+
+        if not self.process.is_alive() and not self.closing:
+            self.poll_timer.stop()
+            self.state = TestState.CANCELED
+            self.state_changed.emit(self.state.value)
+            station_name = self.station.name if self.station else "Station"
+            self.instrument_error.emit(f"{station_name} : PROCESS STOPPED (exit code {self.process.exitcode}).")
+
+    @Slot(int, float, float)
+    def _update_channel_limits(self, channel_id: int, lower_limit: float, upper_limit: float) -> None:
+        channel_view = self._get_channel_view_by_id(channel_id)
+        if channel_view:
+            channel_view.set_limits(lower_limit, upper_limit)
+
+    def _get_channel_view_by_id(self, channel_id: int) -> ChannelMonitorView | None:
+        return next((channel_view for channel_view in self.channel_list if channel_view.channel_id == channel_id), None)
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class StepPhase(Enum):
+    IDLE = 0
+    STARTING = 1
+    EXECUTING = 2
+    FINISHING = 3
+
+
+class CancellationToken:
+    """Shared flag telling the callbacks of a sequence run that it was canceled."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+@dataclass
+class StepTiming:
+    index: int
+    started: float
+    finished: float = 0.0
+    overhead: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+class StepEngine(QObject):
+    """
+    Runs a sequence of steps as an explicit state machine.
+    Every transition goes through a single zero-delay timer, so completing a step never recurses into the next one.
+    """
+
+    def __init__(self, run_step: Callable[[int], None], finish_sequence: Callable[[], None]):
+        super().__init__()
+        self.run_step = run_step
+        self.finish_sequence = finish_sequence
+        self.phase = StepPhase.IDLE
+        self.token = CancellationToken()
+        self.step_index = 0
+        self.step_count = 0
+        self.step_timings: list[StepTiming] = []
+        self._last_transition = 0.0
+
+        self.scheduler = QTimer(self)
+        self.scheduler.setSingleShot(True)
+        self.scheduler.setInterval(0)
+        self.scheduler.timeout.connect(self._on_scheduled)
+
+    def start(self, step_count: int) -> CancellationToken:
+        """Starts a new run of [step_count] steps, canceling the previous one. Returns the run token."""
+        self.token.cancel()
+        self.token = CancellationToken()
+        self.step_index = 0
+        self.step_count = step_count
+        self.step_timings.clear()
+        self._last_transition = perf_counter()
+        self._schedule(StepPhase.STARTING if step_count > 0 else StepPhase.FINISHING)
+        return self.token
+
+    def complete_step(self, token: CancellationToken | None = None) -> None:
+        """Marks the executing step as finished and schedules the next one."""
+        if self.phase is not StepPhase.EXECUTING or (token is not None and token is not self.token):
+            return
+
+        self._last_transition = perf_counter()
+        self.step_timings[-1].finished = self._last_transition
+        self.step_index += 1
+        self._schedule(StepPhase.STARTING if self.step_index < self.step_count else StepPhase.FINISHING)
+
+    def cancel(self) -> None:
+        """Cancels the current run. Pending transitions and token holders are ignored from now on."""
+        self.token.cancel()
+        self.scheduler.stop()
+        self.phase = StepPhase.IDLE
+
+    def is_executing(self) -> bool:
+        return self.phase is StepPhase.EXECUTING and not self.token.cancelled
+
+    def _schedule(self, phase: StepPhase) -> None:
+        self.phase = phase
+        self.scheduler.start()
+
+    def _on_scheduled(self) -> None:
+        if self.token.cancelled:
+            return
+
+        match self.phase:
+            case StepPhase.STARTING:
+                started = perf_counter()
+                self.step_timings.append(StepTiming(self.step_index, started, overhead=started - self._last_transition))
+                self.phase = StepPhase.EXECUTING
+                self.run_step(self.step_index)
+            case StepPhase.FINISHING:
+                self.phase = StepPhase.IDLE
+                self.finish_sequence()
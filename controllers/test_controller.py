@@ -1,19 +1,27 @@
 import os
+from datetime import datetime
 from enum import Enum
-from time import sleep
+from time import monotonic
+from typing import Callable
 
-from PySide6.QtCore import QObject, Signal, QThreadPool, Slot, QTimer
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtCore import QObject, Signal, QThreadPool, Slot
 
-from controllers.arduino_controller import ArduinoController
-from controllers.electronic_load_controller import ElectronicLoadController
+from controllers.channel_runners import ChannelRunner, CurrentLimitingChannelRunner, ShortTestChannelRunner
+from controllers.connection_pool import connection_pool
+from controllers.step_engine import StepEngine
+from models.channel_sample_model import ChannelSample
+from models.station_profile_model import StationProfile
 from models.test_file_model import TestData, Step, Param
 from utils.config_manager import ConfigManager
-from utils.constants import TEST_FILES_DIR
+from utils.constants import TEST_FILES_DIR, SHORT_TEST_SAMPLE_INTERVAL, SHORT_TEST_TIMEOUT, STEP_ORDER_OPTIMIZATION, \
+    SETTLING_SLOPE_THRESHOLD, SETTLING_DWELL_TIME, RECORDING_ENABLED
 from utils.delay_manager import DelayManager
-from utils.monitor_worker import MonitorWorker
+from utils.monitor_worker import MonitorWorker, MONITOR_INTERVAL
 from utils.report_file_util import generate_report_file
-from utils.window_utils import show_custom_dialog
+from utils.sample_history import SampleHistory, TIMESTAMP
+from utils.sample_recorder import SampleRecorder, RECORDING_EXTENSION
+from utils.step_order_optimizer import optimize_step_order
+from utils.voltage_statistics import compute_voltage_statistics, VoltageStatistics, is_settled
 from views.channel_monitor_view import ChannelMonitorView
 
 
@@ -28,7 +36,8 @@ class TestState(Enum):
 
 
 class WorkerSignals(QObject):
-    update_output = Signal()
+    update_output = Signal(tuple)
+    recording_finished = Signal(str)
 
 
 class TestController(QObject):
@@ -36,17 +45,28 @@ class TestController(QObject):
     serial_number_updated = Signal(str)
     current_step_changed = Signal(str, float, int)
     result_file_updated = Signal(str)
+    remaining_time_changed = Signal(int)
+    channel_limits_changed = Signal(int, float, float)
+    instrument_error = Signal(str)
+    step_order_changed = Signal(str)
+    recording_finished = Signal(str)
 
-    def __init__(self, test_data: TestData):
+    def __init__(self, test_data: TestData, station: StationProfile | None = None):
         super().__init__()
         # Data
         self.test_data = test_data
+        self.station = station
         self.channel_list: list[ChannelMonitorView] = []
+        self.sample_history = SampleHistory(list(test_data.channels.keys()))
+        self.channel_runners: list[ChannelRunner] = []
+        self.sequence_steps: list[Step] = []
+        self.step_started: float = 0.0
+        self.run_channels_concurrently: bool = False
+        self.channel_runners_completed: Callable[[list], None] | None = None
         self.state: TestState = TestState.NONE
         self.serial_number: str = ""
         self.tester_id: str = ""
         self.is_single_step_test: bool = False
-        self.current_step_index: int = 0
         self.single_step_index: int = -1
         self.test_result_data = dict()
         self.test_sequence_status: list[bool] = []
@@ -55,16 +75,25 @@ class TestController(QObject):
 
         # Instances
         self.config = ConfigManager()
-        self.electronic_load_controller = ElectronicLoadController()
-        self.arduino_controller = ArduinoController()
+        self.electronic_load_controller = connection_pool.acquire_load(station)
+        self.arduino_controller = connection_pool.acquire_arduino(station)
         self.worker_signals = WorkerSignals()
         self.thread_pool = QThreadPool()
+        # The monitor worker and the sample recorder both run for the whole test.
+        self.thread_pool.setMaxThreadCount(max(self.thread_pool.maxThreadCount(), 2))
         self.monitoring_worker = None
+        self.sample_recorder: SampleRecorder | None = None
         self.delay_manager = DelayManager()
+        self.step_engine = StepEngine(self._run_step, self._finish_sequence)
+
+        if self.test_data.settle_time is not None:
+            self.electronic_load_controller.settle_time = self.test_data.settle_time / 1000
 
         # Signals
         self.worker_signals.update_output.connect(self._update_output_display)
         self.delay_manager.delay_completed.connect(self._on_delay_completed)
+        self.delay_manager.remaining_time_changed.connect(self.remaining_time_changed)
+        self.worker_signals.recording_finished.connect(self.recording_finished)
 
         # Monitor
         if self.electronic_load_controller.conn_status:
@@ -86,7 +115,6 @@ class TestController(QObject):
             self._update_serial_number(self.serial_number_needs_increment)
 
         self._update_state(TestState.RUNNING)
-        self.current_step_index = 0
         self.test_result_data.update(
             group=self.test_data.group,
             model=self.test_data.model,
@@ -99,7 +127,9 @@ class TestController(QObject):
         self.electronic_load_controller.toggle_active_channels_input(
             [key for key in self.test_data.channels.keys()], True)
 
-        self._run_steps()
+        self.sequence_steps = self._plan_sequence_steps()
+        self._start_recording()
+        self.step_engine.start(len(self.sequence_steps))
 
     @Slot(int)
     def setup_single_run(self, step_id: int) -> None:
@@ -129,79 +159,115 @@ class TestController(QObject):
         if self.state not in [TestState.RUNNING, TestState.PAUSED, TestState.WAITKEY, TestState.NONE]:
             return
         self._update_state(TestState.CANCELED)
+        self.step_engine.cancel()
         self.reset_setup()
 
     @Slot()
     def _on_delay_completed(self) -> None:
-        """Called by the delay manager, runs the next test step."""
-        if self.state is not TestState.CANCELED:
+        """Called by the delay manager, validates the step and moves to the next one."""
+        if self.step_engine.is_executing():
             self._validate_direct_current_step_values()
-            self.current_step_index += 1
-            self._run_steps()
-
-    @Slot()
-    def _update_output_display(self) -> None:
-        """Updates each [channel_view] voltage in a dedicated thread."""
-        for channel in self.channel_list:
-            voltage_value = self.electronic_load_controller.get_channel_value(channel.channel_id)
-            channel.set_values((float(voltage_value), None))
-
-    def _run_steps(self) -> None:
+            self.step_engine.complete_step()
+
+    @Slot(tuple)
+    def _update_output_display(self, samples: tuple[ChannelSample, ...]) -> None:
+        """Stores the sample batch acquired by the monitor worker and updates each [channel_view] with it."""
+        self.sample_history.append(samples)
+        if self.sample_recorder is not None:
+            self.sample_recorder.record(samples, self.get_sequence_steps()[self.current_step_index].id
+                                        if self.step_engine.is_executing() else -1)
+        for sample in samples:
+            channel_view = self._get_channel_view_by_id(sample.channel_id)
+            if channel_view:
+                channel_view.set_values((sample.voltage, sample.current))
+        self._drive_channel_runners(samples)
+        self._check_direct_current_early_end()
+
+    @property
+    def current_step_index(self) -> int:
+        return self.step_engine.step_index
+
+    def get_sequence_steps(self) -> list[Step]:
+        """Returns the steps of the running sequence in execution order, reordered by [_plan_sequence_steps()]."""
+        return self.sequence_steps
+
+    def _plan_sequence_steps(self) -> list[Step]:
         """
-        Verifies the step list and runs the tests.
-        At the end of the sequence, verifies the test condition [PASS or FAIL] and handles the test file.
+        Returns the steps to run. The steps marked [order_independent] are reordered to minimize the relay
+        switches and load changes, reporting the estimated time saved through [step_order_changed].
         """
-        sleep(1)
         if self.is_single_step_test:
-            steps = [self.test_data.steps[self.single_step_index]]
-        else:
-            steps = self.test_data.steps
-
-        if self.current_step_index < len(steps):
-            current_step: Step = steps[self.current_step_index]
-            self.arduino_controller.set_input_source(current_step.input_source, self.test_data.input_type)
-            self.current_step_changed.emit(current_step.description, current_step.duration, self.current_step_index)
-            self._update_display_limits(current_step)
-            match current_step.step_type:
-                case 1:
-                    self._run_direct_current_step(current_step)
-                case 2:
-                    self._set_current_limiting_step(current_step)
-                case 3:
-                    self._set_short_test_step(current_step)
+            return [self.test_data.steps[self.single_step_index]]
+        if not self.config.get_bool(STEP_ORDER_OPTIMIZATION):
+            return self.test_data.steps
+
+        input_type = self.test_data.input_type
+        plan = optimize_step_order(
+            self.test_data.steps, self.arduino_controller.get_input_source(input_type),
+            lambda param_id: getattr(self._get_channel_params_by_id(param_id), "ia", 0.0),
+            lambda input_source: self.arduino_controller.get_input_source_settle_time(input_source, input_type),
+            self.electronic_load_controller.settle_time)
+        if plan.reordered:
+            self.step_order_changed.emit(
+                f"{plan.relay_switches_before} -> {plan.relay_switches_after} relay switches, "
+                f"{plan.load_changes_before} -> {plan.load_changes_after} load changes, "
+                f"~{plan.estimated_time_saved:.1f}s saved")
+        return plan.steps
+
+    def _run_step(self, index: int) -> None:
+        """Called by the step engine, configures and starts the step at [index]."""
+        current_step: Step = self.get_sequence_steps()[index]
+        self.arduino_controller.set_input_source(current_step.input_source, self.test_data.input_type)
+        self.current_step_changed.emit(current_step.description, current_step.duration, index)
+        self._update_display_limits(current_step)
+        match current_step.step_type:
+            case 1:
+                self._run_direct_current_step(current_step)
+            case 2:
+                self._set_current_limiting_step(current_step)
+            case 3:
+                self._set_short_test_step(current_step)
+
+    def _finish_sequence(self) -> None:
+        """
+        Called by the step engine after the last step.
+        Verifies the test condition [PASS or FAIL] and handles the test file.
+        """
+        self.electronic_load_controller.toggle_active_channels_input(
+            [key for key in self.test_data.channels.keys()], False)
+        if self.temp_data_file:
+            self.temp_data_file.close()
+            os.remove(self.temp_data_file.name)
 
-        else:
-            self.electronic_load_controller.toggle_active_channels_input(
-                [key for key in self.test_data.channels.keys()], False)
-            if self.temp_data_file:
-                self.temp_data_file.close()
-                os.remove(self.temp_data_file.name)
-
-            if self.state is not TestState.CANCELED:
-                self._update_state(TestState.FAILED if False in self.test_sequence_status else TestState.PASSED)
-
-            self.temp_data_file = generate_report_file(self.test_result_data)
-            self.result_file_updated.emit(self._read_temp_data_file())
-            if self.state is TestState.PASSED and not self.is_single_step_test:
-                with open(file=f"{self.config.get(TEST_FILES_DIR)}/{self.test_data.group}/{self.serial_number}.txt",
-                          mode="w", encoding="utf-8") as test_file:
-                    test_file.write(self._read_temp_data_file())
-                self._update_serial_number(True)
-            self._update_output_display()
-            self.arduino_controller.buzzer()
-            self.reset_setup()
+        if self.state is not TestState.CANCELED:
+            self._update_state(TestState.FAILED if False in self.test_sequence_status else TestState.PASSED)
+
+        self.temp_data_file = generate_report_file(self.test_result_data)
+        self.result_file_updated.emit(self._read_temp_data_file())
+        if self.state is TestState.PASSED and not self.is_single_step_test:
+            with open(file=f"{self.config.get(TEST_FILES_DIR)}/{self.test_data.group}/{self.serial_number}.txt",
+                      mode="w", encoding="utf-8") as test_file:
+                test_file.write(self._read_temp_data_file())
+            self._update_serial_number(True)
+        self.arduino_controller.buzzer()
+        self.reset_setup()
 
     def _update_display_limits(self, current_step: Step) -> None:
         """Updates the limits on each [channel_view] slider."""
         for channel_id, param_id in current_step.channel_params.items():
-            channel_view = self._get_channel_view_by_id(channel_id)
             channel_params = self._get_channel_params_by_id(param_id)
+            if channel_params is None:
+                continue
             if current_step.step_type == 1:
-                channel_view.set_limits(channel_params.va, channel_params.vb)
+                limits = (channel_params.va, channel_params.vb)
             else:
                 lower_value = channel_params.va * 0.5
                 upper_value = channel_params.va + lower_value
-                channel_view.set_limits(round(lower_value, 2), round(upper_value, 2))
+                limits = (round(lower_value, 2), round(upper_value, 2))
+            channel_view = self._get_channel_view_by_id(channel_id)
+            if channel_view is not None:
+                channel_view.set_limits(*limits)
+            self.channel_limits_changed.emit(channel_id, *limits)
 
     def _read_temp_data_file(self) -> str:
         if self.temp_data_file:
@@ -211,63 +277,38 @@ class TestController(QObject):
 
     def _set_short_test_step(self, current_step: Step) -> None:
         self._update_state(TestState.NONE)
-        channels_data = []
+        runners = []
         for channel_id, param_id in current_step.channel_params.items():
-            channels_data.append({'id': channel_id, 'param_id': param_id, 'shutdown': False, 'recovery': False})
-        self._run_short_test(channels_data)
-
-    def _run_short_test(self, data: list[dict], current_index: int = 0, current_cycle: int = 0) -> None:
-        """Sets the channel for [SHORT] mode and recursively verifies both states [shutdown, recovery]."""
-        if self.state is TestState.CANCELED:
-            return
-        delay = 500
-        if current_index < len(data):
-            current_channel = data[current_index]
-            channel_params = self._get_channel_params_by_id(current_channel["param_id"])
-            if current_cycle == 0:
-                self.electronic_load_controller.set_channel_current(current_channel["id"], channel_params.ia)
-
-            current_channel_view = self._get_channel_view_by_id(current_channel["id"])
-            channel_values = current_channel_view.get_display_values()
-            voltage_read = channel_values["voltage"]
-            if current_cycle < 20 and not current_channel["recovery"]:
-                if voltage_read >= channel_params.va * 0.2 and not current_channel["shutdown"]:
-                    self.electronic_load_controller.toggle_short_mode(current_channel["id"], True)
-                elif voltage_read <= channel_params.va * 0.2 and not current_channel["shutdown"]:
-                    current_channel["shutdown"] = True
-                    self.electronic_load_controller.toggle_short_mode(current_channel["id"], False)
-                elif voltage_read >= channel_params.va and current_channel["shutdown"] and not current_channel[
-                    "recovery"]:
-                    current_channel["recovery"] = True
-
-                QTimer.singleShot(delay, lambda: self._run_short_test(data, current_index, current_cycle + 1))
-            else:
-                self.electronic_load_controller.set_channel_current(current_channel["id"], 0)
-                QTimer.singleShot(delay, lambda: self._run_short_test(data, current_index + 1, 0))
-        else:
-            self._validate_short_test_step(data)
-            self.current_step_index += 1
-            self._run_steps()
-
-    def _validate_short_test_step(self, data: list[dict]) -> None:
+            params = self._get_channel_params_by_id(param_id)
+            runners.append(ShortTestChannelRunner(self.electronic_load_controller, channel_id, param_id, params,
+                                                  int(self.config.get(SHORT_TEST_TIMEOUT)) / 1000))
+        self._set_monitoring_interval(int(self.config.get(SHORT_TEST_SAMPLE_INTERVAL)) / 1000)
+        self._start_channel_runners(runners, current_step.concurrent, self._complete_short_test_step)
+
+    def _complete_short_test_step(self, runners: list[ShortTestChannelRunner]) -> None:
+        self._set_monitoring_interval(MONITOR_INTERVAL)
+        self._validate_short_test_step(runners)
+        self.step_engine.complete_step()
+
+    def _validate_short_test_step(self, runners: list[ShortTestChannelRunner]) -> None:
         """Validates the [SHORT] mode test, verifying the [recovery] and [shutdown] states."""
         step_pass = False
         channels_pass = []
         current_step_data = []
-        current_step = self.test_data.steps[
-            self.single_step_index if self.is_single_step_test else self.current_step_index]
-        for channel in data:
+        current_step = self.get_sequence_steps()[self.current_step_index]
+        for runner in runners:
             channel_data = {}
-            channel_params = self._get_channel_params_by_id(channel["param_id"])
-            if channel_params:
+            if runner.params:
                 channel_data = {
-                    "channel_id": str(channel["id"]),
-                    "shutdown": channel["shutdown"],
-                    "recovery": channel["recovery"],
-                    "voltage_ref": channel_params.va,
-                    "load": channel_params.ia
+                    "channel_id": str(runner.channel_id),
+                    "shutdown": runner.shutdown,
+                    "recovery": runner.recovery,
+                    "shutdown_time": runner.shutdown_time,
+                    "recovery_time": runner.recovery_time,
+                    "voltage_ref": runner.params.va,
+                    "load": runner.params.ia
                 }
-                channels_pass.append(channel["shutdown"] and channel["recovery"])
+                channels_pass.append(runner.shutdown and runner.recovery)
 
             step_pass = False not in channels_pass
             current_step_data.append(channel_data)
@@ -276,93 +317,59 @@ class TestController(QObject):
         self._handle_test_results_data(current_step, tuple(current_step_data), step_pass)
 
     def _run_direct_current_step(self, current_step: Step) -> None:
-        """Sets the channel current and handles the step delay."""
+        """
+        Sets the channel current and handles the step delay, extended if needed so the validated samples are
+        acquired after the input source relay settled.
+        """
+        self.step_started = monotonic()
         for channel_id, param_id in current_step.channel_params.items():
             channel_params = self._get_channel_params_by_id(param_id)
             if channel_params:
                 self.electronic_load_controller.set_channel_current(channel_id, channel_params.ia)
                 channel_view = self._get_channel_view_by_id(channel_id)
-                channel_view.set_values((None, channel_params.ia))
+                if channel_view:
+                    channel_view.set_values((None, channel_params.ia))
 
         if current_step.duration == 0:
             self._update_state(TestState.WAITKEY)
         else:
-            self.delay_manager.start_delay(current_step.duration * 1000)
+            relay_settle_time = self.arduino_controller.get_remaining_settle_time()
+            if relay_settle_time > 0:
+                relay_settle_time += MONITOR_INTERVAL
+            self.delay_manager.start_delay(max(current_step.duration, relay_settle_time) * 1000)
 
     def _set_current_limiting_step(self, current_step: Step) -> None:
         self._update_state(TestState.NONE)
-        self._run_current_limiting_step(current_step.channel_params, None, None)
-
-    def _run_current_limiting_step(self, channel_params: dict[int, int], data: list[dict] | None,
-                                   current_load: float | None,
-                                   current_index: int = 0) -> None:
-        """Sets the channel for testing and recursively increases the current until the limit is reached."""
+        runners = []
+        for channel_id, param_id in current_step.channel_params.items():
+            params = self._get_channel_params_by_id(param_id)
+            runners.append(CurrentLimitingChannelRunner(self.electronic_load_controller, channel_id, param_id, params,
+                                                        current_step.search_strategy, current_step.search_resolution))
+        self._start_channel_runners(runners, current_step.concurrent, self._complete_current_limiting_step)
 
-        if self.state is TestState.CANCELED:
-            return
-        if not data:
-            channels_data = []
-            for channel_id, param_id in channel_params.items():
-                channels_data.append({'id': channel_id, 'param_id': param_id, 'limit': 0.0, 'done': False})
-        else:
-            channels_data = data
-
-        if current_index < len(channels_data):
-
-            current_channel = channels_data[current_index]
-            current_channel_view = self._get_channel_view_by_id(current_channel["id"])
-            params = self._get_channel_params_by_id(current_channel["param_id"])
-            if not current_load:
-                current_load = params.ia
-
-            channel_values = current_channel_view.get_display_values()
-            voltage_read = channel_values["voltage"]
-            if not current_channel["done"]:
-                if voltage_read >= params.va and current_load <= params.ib:
-                    current_load += 0.01
-                    self.electronic_load_controller.set_channel_current(current_channel["id"], current_load)
-                    current_channel_view.set_values((None, current_load))
-                    QTimer.singleShot(100, lambda: self._run_current_limiting_step(channel_params, channels_data,
-                                                                                   current_load, current_index))
-                else:
-                    current_channel["limit"] = current_load
-                    self.electronic_load_controller.set_channel_current(current_channel["id"], params.ia)
-                    current_channel_view.set_values((None, params.ia))
-                    current_channel["done"] = True
-                    QTimer.singleShot(100, lambda: self._run_current_limiting_step(channel_params, channels_data,
-                                                                                   params.ia, current_index))
-            else:
-                if voltage_read <= params.va:
-                    QTimer.singleShot(100, lambda: self._run_current_limiting_step(channel_params, channels_data,
-                                                                                   params.ia, current_index))
-                else:
-                    QTimer.singleShot(100, lambda: self._run_current_limiting_step(channel_params, channels_data,
-                                                                                   params.ia, current_index + 1))
-        else:
-            self._update_state(TestState.RUNNING)
-            self._validate_current_limiting_step_values(channels_data)
-            self.current_step_index += 1
-            self._run_steps()
+    def _complete_current_limiting_step(self, runners: list[CurrentLimitingChannelRunner]) -> None:
+        self._update_state(TestState.RUNNING)
+        self._validate_current_limiting_step_values(runners)
+        self.step_engine.complete_step()
 
-    def _validate_current_limiting_step_values(self, data: list[dict]) -> None:
+    def _validate_current_limiting_step_values(self, runners: list[CurrentLimitingChannelRunner]) -> None:
         """Validates and creates a dict with the current limiting test values."""
         step_pass = False
         channels_pass = []
         current_step_data = []
-        current_step = self.test_data.steps[
-            self.single_step_index if self.is_single_step_test else self.current_step_index]
-        for channel in data:
+        current_step = self.get_sequence_steps()[self.current_step_index]
+        for runner in runners:
             channel_data = {}
-            channel_params = self._get_channel_params_by_id(channel["param_id"])
+            channel_params = runner.params
             if channel_params:
                 channel_data = {
-                    "channel_id": str(channel["id"]),
+                    "channel_id": str(runner.channel_id),
                     "under_voltage": channel_params.va,
                     "load_upper": channel_params.ib,
                     "load_lower": channel_params.ia,
-                    "load": channel["limit"]
+                    "load": runner.limit
                 }
-                channels_pass.append(True if channel_params.ia < channel["limit"] <= channel_params.ib else False)
+                channels_pass.append(True if channel_params.ia < runner.limit <= channel_params.ib else False)
 
             step_pass = False not in channels_pass
             self.test_sequence_status.append(step_pass)
@@ -370,21 +377,54 @@ class TestController(QObject):
 
         self._handle_test_results_data(current_step, tuple(current_step_data), step_pass)
 
+    def _start_channel_runners(self, runners: list[ChannelRunner], concurrent: bool,
+                               on_completed: Callable[[list], None]) -> None:
+        """
+        Starts driving the [runners] with the acquisition scans.
+        If [concurrent], every channel advances on each scan, else one channel at a time.
+        """
+        self.channel_runners = runners
+        self.run_channels_concurrently = concurrent
+        self.channel_runners_completed = on_completed
+
+    def _drive_channel_runners(self, samples: tuple[ChannelSample, ...]) -> None:
+        """
+        Advances the active channel runners with the [samples] of the current scan. Scans acquired before the input
+        source relay settled are skipped.
+        """
+        if not self.channel_runners or not self.step_engine.is_executing():
+            return
+        if samples and samples[0].timestamp < self.arduino_controller.get_settle_deadline():
+            return
+
+        samples_by_channel = {sample.channel_id: sample for sample in samples}
+        pending_runners = [runner for runner in self.channel_runners if not runner.done]
+        active_runners = pending_runners if self.run_channels_concurrently else pending_runners[:1]
+        for runner in active_runners:
+            runner.update(samples_by_channel.get(runner.channel_id))
+
+        if all(runner.done for runner in self.channel_runners):
+            runners = self.channel_runners
+            self.channel_runners = []
+            self.channel_runners_completed(runners)
+
     def _validate_direct_current_step_values(self) -> None:
-        """Validates and creates a dict with the direct current test values."""
+        """
+        Validates and creates a dict with the direct current test values.
+        A [statistical] step validates the mean of the samples acquired since the instruments settled instead of the
+        latest one, reporting their peak-to-peak ripple, limited only by the [max_ripple] of the step.
+        """
         step_pass = False
         channels_pass = []
         current_step_data = []
-        current_step = self.test_data.steps[
-            self.single_step_index if self.is_single_step_test else self.current_step_index]
+        current_step = self.get_sequence_steps()[self.current_step_index]
         for channel_id, param_id in current_step.channel_params.items():
-            channel_view = self._get_channel_view_by_id(channel_id)
-            values = channel_view.get_display_values()
+            values = self._get_sample_values(channel_id)
             channel_data = {}
             channel_params = self._get_channel_params_by_id(param_id)
             if channel_params:
                 channel_data = {
-                    "channel_id": str(channel_view.channel_id),
+                    "channel_id": str(channel_id),
                     "outcome_voltage": values.get("voltage", 0.0),
                     "lower_voltage": channel_params.va,
                     "upper_voltage": channel_params.vb,
@@ -392,22 +432,83 @@ class TestController(QObject):
                     "power": values.get("power", 0.0)
                 }
 
-                channels_pass.append(
-                    True if channel_params.va <= values.get("voltage", 0.0) <= channel_params.vb else False)
+                statistics = self._get_step_statistics(current_step, channel_id) \
+                    if current_step.validation == "statistical" else None
+                if statistics is not None:
+                    channel_data.update(outcome_voltage=statistics.mean, ripple=statistics.ripple,
+                                        power=statistics.mean * values.get("current", 0.0))
+                    channels_pass.append(
+                        statistics.is_inside(channel_params.va, channel_params.vb, current_step.max_ripple))
+                else:
+                    channels_pass.append(
+                        True if channel_params.va <= values.get("voltage", 0.0) <= channel_params.vb else False)
 
             step_pass = False not in channels_pass
             self.test_sequence_status.append(step_pass)
             current_step_data.append(channel_data)
 
-        self._handle_test_results_data(current_step, tuple(current_step_data), step_pass)
+        step_time = monotonic() - self.step_started \
+            if current_step.end_on_settled or current_step.early_pass_time > 0 else None
+        self._handle_test_results_data(current_step, tuple(current_step_data), step_pass, step_time)
+
+    def _get_validation_start(self, current_step: Step) -> float:
+        """Returns when the input source relay and the loads of [current_step] settled, on the monotonic clock."""
+        return max(self.step_started, self.arduino_controller.get_settle_deadline(),
+                   *(self.electronic_load_controller.get_settle_deadline(channel_id)
+                     for channel_id in current_step.channel_params.keys()))
+
+    def _get_step_statistics(self, current_step: Step, channel_id: int) -> VoltageStatistics | None:
+        """Returns the voltage statistics of [channel_id] since the validation start, None without samples."""
+        history = self.sample_history.get(channel_id)
+        if history is None:
+            return None
+        return compute_voltage_statistics(history.since(self._get_validation_start(current_step)))
+
+    def _check_direct_current_early_end(self) -> None:
+        """
+        Ends the delay of a Direct Current step before its duration once every channel is verifiably stable: its
+        mean inside its limits over the [early_pass_time] of a [statistical] step, or settled (inside its limits
+        with a slope below [SETTLING_SLOPE_THRESHOLD] for [SETTLING_DWELL_TIME]) on an [end_on_settled] step.
+        """
+        if self.state is not TestState.RUNNING or not self.delay_manager.active or not self.step_engine.is_executing():
+            return
+        current_step = self.get_sequence_steps()[self.current_step_index]
+        early_pass = current_step.validation == "statistical" and current_step.early_pass_time > 0
+        if current_step.step_type != 1 or not (early_pass or current_step.end_on_settled):
+            return
 
-    def _handle_test_results_data(self, current_step: Step, data: tuple, step_status: bool) -> None:
+        validation_start = self._get_validation_start(current_step)
+        dwell_time = int(self.config.get(SETTLING_DWELL_TIME)) / 1000
+        slope_threshold = float(self.config.get(SETTLING_SLOPE_THRESHOLD))
+        for channel_id, param_id in current_step.channel_params.items():
+            channel_params = self._get_channel_params_by_id(param_id)
+            history = self.sample_history.get(channel_id)
+            if channel_params is None or history is None:
+                return
+            window = history.since(validation_start)
+            statistics = compute_voltage_statistics(window)
+            if statistics is None:
+                return
+            inside = statistics.is_inside(channel_params.va, channel_params.vb, current_step.max_ripple)
+            if early_pass and inside and window[TIMESTAMP, -1] - validation_start >= current_step.early_pass_time:
+                continue
+            if current_step.end_on_settled and \
+                    is_settled(window, channel_params.va, channel_params.vb, dwell_time, slope_threshold):
+                continue
+            return
+        self.delay_manager.finish()
+
+    def _handle_test_results_data(self, current_step: Step, data: tuple, step_status: bool,
+                                  step_time: float | None = None) -> None:
+        """Adds the step result, with the actual [step_time] of the steps that can end before their duration."""
         step_data = {
             "description": current_step.description,
             "step_status": step_status,
             "step_type": current_step.step_type,
             "channels_data": data
         }
+        if step_time is not None:
+            step_data.update(step_time=step_time, duration=current_step.duration)
         self.test_result_data["steps_result"].append(step_data)
 
     def reset_setup(self) -> None:
@@ -416,12 +517,28 @@ class TestController(QObject):
             [key for key in self.test_data.channels.keys()], False)
         self.arduino_controller.setup_active_pin(True)
         self.arduino_controller.active_pin = 0
-        self.delay_manager.paused = False
-        self.delay_manager.remaining_time = 0
+        self.delay_manager.cancel()
+        self._stop_recording()
         self.is_single_step_test = False
         self.single_step_index = -1
+        self.channel_runners = []
+        self._set_monitoring_interval(MONITOR_INTERVAL)
         self.test_sequence_status.clear()
 
+    def close(self) -> None:
+        """
+        Stops the monitoring and the recording, resets the instruments and returns their sessions to the
+        [connection_pool].
+        """
+        self._stop_recording()
+        if self.monitoring_worker is not None:
+            self.monitoring_worker.stop()
+        self.thread_pool.waitForDone()
+        self.step_engine.cancel()
+        self.reset_setup()
+        connection_pool.release_load(self.electronic_load_controller)
+        connection_pool.release_arduino(self.arduino_controller)
+
     def _update_state(self, new_state: TestState) -> None:
         """Updates the current test state."""
         if self.state != new_state:
@@ -437,21 +554,71 @@ class TestController(QObject):
     def _start_monitoring(self) -> None:
         """Creates a new thread worker case it's None, else resume it."""
         if self.monitoring_worker is None:
-            self.monitoring_worker = MonitorWorker(self.worker_signals)
+            self.monitoring_worker = MonitorWorker(self.worker_signals, self.electronic_load_controller,
+                                                   list(self.test_data.channels.keys()))
             self.thread_pool.start(self.monitoring_worker)
         else:
             self.monitoring_worker.resume()
 
+    def _start_recording(self) -> None:
+        """
+        Starts streaming the samples of the unit to [TEST_FILES_DIR]/[group]/recordings when [RECORDING_ENABLED].
+        A recording that can not be created is reported without stopping the test.
+        """
+        if not self.config.get_bool(RECORDING_ENABLED):
+            return
+        recordings_dir = f"{self.config.get(TEST_FILES_DIR)}/{self.test_data.group}/recordings"
+        started = datetime.now()
+        metadata = {
+            "serial_number": self.serial_number,
+            "group": self.test_data.group,
+            "model": self.test_data.model,
+            "station": self.station.name if self.station else "",
+            "started": started.isoformat(timespec="seconds"),
+            "channels": {str(channel_id): name for channel_id, name in self.test_data.channels.items()},
+            "steps": {str(step.id): step.description for step in self.sequence_steps},
+        }
+        try:
+            os.makedirs(recordings_dir, exist_ok=True)
+            file_name = f"{self.serial_number}_{started.strftime('%Y%m%d_%H%M%S')}{RECORDING_EXTENSION}"
+            self.sample_recorder = SampleRecorder(self.worker_signals, f"{recordings_dir}/{file_name}", metadata)
+        except OSError as error:
+            self.instrument_error.emit(f"RECORDER : {error.strerror or error}.")
+            return
+        except ValueError as error:
+            self.instrument_error.emit(f"RECORDER : {error}")
+            return
+        self.thread_pool.start(self.sample_recorder)
+
+    def _stop_recording(self) -> None:
+        if self.sample_recorder is not None:
+            self.sample_recorder.stop()
+            self.sample_recorder = None
+
+    def _set_monitoring_interval(self, interval: float) -> None:
+        if self.monitoring_worker is not None:
+            self.monitoring_worker.set_interval(interval)
+
     def _check_instruments(self) -> bool:
-        """Checks for the instruments connection."""
+        """Checks for the instruments connection, emitting [instrument_error] if one is missing."""
+        station_prefix = f"{self.station.name} - " if self.station else ""
         if not self.electronic_load_controller.conn_status:
-            show_custom_dialog("IT8700 : INSTRUMENT NOT FOUND.", QMessageBox.Icon.Critical)
+            self.instrument_error.emit(f"{station_prefix}IT8700 : INSTRUMENT NOT FOUND.")
             return False
         if not self.arduino_controller.check_connection():
-            show_custom_dialog("ARDUINO : INSTRUMENT NOT FOUND.", QMessageBox.Icon.Critical)
+            self.instrument_error.emit(f"{station_prefix}ARDUINO : INSTRUMENT NOT FOUND.")
             return False
         return True
 
+    def _get_sample_values(self, channel_id: int) -> dict[str, float]:
+        """Returns the latest acquired voltage, current and power of [channel_id]."""
+        history = self.sample_history.get(channel_id)
+        sample = history.latest() if history is not None else None
+        if sample is None:
+            return {"voltage": 0.0, "current": 0.0, "power": 0.0}
+        current = sample.current or 0.0
+        return {"voltage": sample.voltage, "current": current, "power": sample.voltage * current}
+
     def _get_channel_params_by_id(self, param_id: int) -> Param | None:
         return next((param for param in self.test_data.params if param.id == param_id), None)
 
@@ -1,8 +1,18 @@
+import multiprocessing
 import sys
 
+from utils.startup_profiler import startup_profiler, STARTUP_PROFILE_ARGUMENT
+
+if STARTUP_PROFILE_ARGUMENT in sys.argv:
+    startup_profiler.start()
+
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 from utils.assets_path_util import resource_path
+from utils.config_manager import ConfigManager
+from utils.constants import IO_METRICS_ENABLED
+from utils.io_metrics import io_metrics
 from views.main_window import MainWindow
 
 
@@ -12,14 +22,32 @@ def load_stylesheet(file_path: str):
         return file.read()
 
 
+def report_startup_profile() -> None:
+    """Called on the first event loop iteration, stops the startup profiler and prints its report."""
+    startup_profiler.mark("Event loop running")
+    startup_profiler.stop()
+    print(startup_profiler.format_report(), file=sys.stderr)
+
+
 def main():
+    startup_profiler.mark("Modules imported")
     app = QApplication(sys.argv)
     app.setStyleSheet(load_stylesheet("assets/style.qss"))
+    io_metrics.enabled = ConfigManager().get_bool(IO_METRICS_ENABLED)
+    startup_profiler.mark("Application created")
     main_window = MainWindow()
     main_window.show()
+    startup_profiler.mark("Main window shown")
+    if startup_profiler.enabled:
+        QTimer.singleShot(0, report_startup_profile)
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    # The pool is only imported once a test or the settings were opened.
+    if "controllers.connection_pool" in sys.modules:
+        sys.modules["controllers.connection_pool"].connection_pool.close_all()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
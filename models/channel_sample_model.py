@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ChannelSample:
+    channel_id: int
+    timestamp: float
+    voltage: float
+    current: float | None = None
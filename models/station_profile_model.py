@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StationProfile:
+    """Instruments of one test fixture: an IT8700 load and the Arduino switching its input sources."""
+    name: str
+    sat_resource_path: str
+    arduino_resource_path: str
+    arduino_serial_port: str
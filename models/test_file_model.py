@@ -1,5 +1,8 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from utils.constants import VALIDATION_MODES
+from utils.current_limit_search import SEARCH_STRATEGIES
 
 
 @dataclass
@@ -20,6 +23,25 @@ class Step:
     duration: float
     input_source: int
     channel_params: Dict[int, int]
+    search_strategy: str = "linear"
+    search_resolution: float = 0.01
+    concurrent: bool = False
+    order_independent: bool = False
+    validation: str = "snapshot"
+    early_pass_time: float = 0.0
+    end_on_settled: bool = False
+    max_ripple: float = 0.0
+
+    def __post_init__(self):
+        """Rejects the step settings that would only fail once the sequence reaches the step."""
+        if self.search_strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"Step {self.id}: unknown search strategy '{self.search_strategy}'.")
+        if not isinstance(self.search_resolution, (int, float)) or not self.search_resolution > 0:
+            raise ValueError(f"Step {self.id}: the search resolution must be greater than 0.")
+        if self.validation not in VALIDATION_MODES:
+            raise ValueError(f"Step {self.id}: unknown validation '{self.validation}'.")
+        if not isinstance(self.max_ripple, (int, float)) or self.max_ripple < 0:
+            raise ValueError(f"Step {self.id}: the maximum ripple can not be negative.")
 
 
 @dataclass
@@ -32,6 +54,7 @@ class TestData:
     channels: Dict[int, str] = field(default_factory=dict)
     params: List['Param'] = field(default_factory=list)
     steps: List['Step'] = field(default_factory=list)
+    settle_time: Optional[int] = None
 
     def __post_init__(self):
         self.steps = [Step(**step) if isinstance(step, dict) else step for step in self.steps]
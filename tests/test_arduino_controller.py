@@ -0,0 +1,67 @@
+import json
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtTest import QTest
+
+from controllers.arduino_controller import ArduinoController
+from utils.config_manager import ConfigManager
+from utils.constants import SIMULATION_ENABLED, SIMULATION_LATENCY, ARDUINO_BULK_WRITE, ARDUINO_BREAK_TIME, \
+    ARDUINO_RELAY_SETTLE_TIMES
+
+BREAK_TIME = 20
+SETTLE_TIME = 50
+
+
+@pytest.fixture(scope="module")
+def app() -> QCoreApplication:
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def create_controller(monkeypatch, bulk_write: bool) -> ArduinoController:
+    monkeypatch.setattr(ConfigManager, "overrides", {SIMULATION_ENABLED: True, SIMULATION_LATENCY: 0,
+                                                     ARDUINO_BULK_WRITE: bulk_write, ARDUINO_BREAK_TIME: BREAK_TIME,
+                                                     ARDUINO_RELAY_SETTLE_TIMES: json.dumps({"5": SETTLE_TIME})})
+    return ArduinoController()
+
+
+def get_change_time(controller: ArduinoController, pin: int, value: int) -> float:
+    """Returns when the simulated [pin] last changed to [value]."""
+    return next(time for time, changed_pin, changed_value in reversed(controller.arduino.conn.pin_changes)
+                if (changed_pin, changed_value) == (pin, value))
+
+
+@pytest.mark.parametrize("bulk_write", [False, True])
+def test_change_output_breaks_before_make(app, monkeypatch, bulk_write):
+    controller = create_controller(monkeypatch, bulk_write)
+    controller.change_output(4)
+    QTest.qWait(5 * BREAK_TIME)
+    controller.change_output(5)
+    QTest.qWait(5 * BREAK_TIME)
+
+    assert controller.arduino.conn.pins[4] == 0 and controller.arduino.conn.pins[5] == 1
+    assert get_change_time(controller, 5, 1) - get_change_time(controller, 4, 0) >= BREAK_TIME / 1000
+    controller.close()
+
+
+def test_superseded_make_pass_is_not_applied(app, monkeypatch):
+    controller = create_controller(monkeypatch, False)
+    controller.change_output(4)
+    controller.setup_active_pin(True)
+    QTest.qWait(5 * BREAK_TIME)
+
+    assert not any(controller.arduino.conn.pins.values())
+    controller.close()
+
+
+@pytest.mark.parametrize("bulk_write", [False, True])
+def test_settle_deadline_counts_from_the_make_pass(app, monkeypatch, bulk_write):
+    controller = create_controller(monkeypatch, bulk_write)
+    controller.change_output(5)
+    QTest.qWait(5 * BREAK_TIME)
+
+    assert controller.get_settle_deadline() >= get_change_time(controller, 5, 1) + SETTLE_TIME / 1000
+    controller.close()
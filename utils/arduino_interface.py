@@ -1,34 +1,50 @@
+from time import perf_counter
+
 import serial
 
 from utils.config_manager import ConfigManager
 from utils.constants import ARDUINO_SERIAL_PORT, ARDUINO_BAUD_RATE, ARDUINO_READ_TIMEOUT
+from utils.io_metrics import io_metrics
+
+METRICS_DEVICE = "ARDUINO"
 
 
 class Arduino:
-    def __init__(self):
+    def __init__(self, conn=None, port: str | None = None):
+        """
+        Opens the serial [port] (the configured one if not given), unless an already open [conn] (e.g. a simulator)
+        is given.
+        """
         self.config = ConfigManager()
-        self.conn = serial.Serial(self.config.get(ARDUINO_SERIAL_PORT), self.config.get(ARDUINO_BAUD_RATE))
+        if conn is None:
+            conn = serial.Serial(port or self.config.get(ARDUINO_SERIAL_PORT), self.config.get(ARDUINO_BAUD_RATE))
+        self.conn = conn
         self.conn.timeout = ARDUINO_READ_TIMEOUT
 
     def set_pin_mode(self, pin_number: int, mode: str) -> None:
         """
         Performs a pinMode() operation on pin_number.
-        Internally sends b'M{mode}{pin_number} where mode could be:
+        Internally sends b'M{mode}{pin_number}\\n' where mode could be:
          - I for INPUT
          - O for OUTPUT
          - P for INPUT_PULLUP
         """
-        command = ("".join(("M", mode, str(pin_number)))).encode()
+        command = ("".join(("M", mode, str(pin_number), "\n"))).encode()
         self.conn.write(command)
 
     def digital_read(self, pin_number: int) -> int | None:
         """
         Performs a digital read on pin_number and returns the value (1 or 0).
-        Internally sends b'RD{pin_number}' over the serial connection.
+        Internally sends b'RD{pin_number}\\n' over the serial connection.
         """
-        command = ("".join(("RD", str(pin_number)))).encode()
+        command = ("".join(("RD", str(pin_number), "\n"))).encode()
+        started = perf_counter() if io_metrics.enabled else 0.0
         self.conn.write(command)
         line_received = self.conn.readline().decode().strip()
+        if io_metrics.enabled:
+            io_metrics.record(METRICS_DEVICE, "RD", perf_counter() - started, line_received == "")
+        if not line_received:
+            return None
         header, value = line_received.split(":")
         if header == ("D" + str(pin_number)):
             return int(value)
@@ -36,7 +52,29 @@ class Arduino:
     def digital_write(self, pin_number: int, digital_value: int) -> None:
         """
         Writes the digital_value on pin_number.
-        Internally sends b'WD{pin_number}:{digital_value}' over the serial connection.
+        Internally sends b'WD{pin_number}:{digital_value}\\n' over the serial connection.
+        """
+        command = ("".join(("WD", str(pin_number), ":", str(digital_value), "\n"))).encode()
+        started = perf_counter() if io_metrics.enabled else 0.0
+        self.conn.write(command)
+        if io_metrics.enabled:
+            io_metrics.record(METRICS_DEVICE, "WD", perf_counter() - started)
+
+    def write_pins(self, pins_mask: int, break_time: int = 0) -> bool:
+        """
+        Writes every output pin in a single frame, pin N taking the value of the bit N of pins_mask.
+        The device first clears the pins being turned off, waits break_time (ms) and only then sets the pins being
+        turned on (break-before-make), answering 'P:{pins_mask}' with the resulting outputs.
+        Internally sends b'WP{pins_mask}:{break_time}\\n'. Returns True if the frame was acknowledged.
         """
-        command = ("".join(("WD", str(pin_number), ":", str(digital_value)))).encode()
+        command = ("".join(("WP", str(pins_mask), ":", str(break_time), "\n"))).encode()
+        started = perf_counter() if io_metrics.enabled else 0.0
         self.conn.write(command)
+        line_received = self.conn.readline().decode().strip()
+        if io_metrics.enabled:
+            io_metrics.record(METRICS_DEVICE, "WP", perf_counter() - started, line_received == "")
+        return line_received == "".join(("P:", str(pins_mask)))
+
+    def close(self) -> None:
+        """Closes the serial connection."""
+        self.conn.close()
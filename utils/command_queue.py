@@ -0,0 +1,169 @@
+import heapq
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from itertools import count
+from time import perf_counter
+
+from pyvisa import VisaIOError
+from pyvisa.constants import VI_ERROR_TMO
+from PySide6.QtCore import QRunnable, QMutex, QWaitCondition, QMutexLocker
+
+from utils.io_metrics import io_metrics, command_name
+from utils.scpi_commands import SELECT_CHANNEL, RESET, COMMAND_SEPARATOR, RESPONSE_SEPARATOR
+
+
+METRICS_DEVICE = "SAT"
+
+
+class CommandLane(IntEnum):
+    CONTROL = 0
+    MONITOR = 1
+
+
+@dataclass(order=True)
+class QueuedCommand:
+    lane: int
+    sequence: int
+    command: str = field(compare=False)
+    channel_id: int | None = field(compare=False)
+    is_query: bool = field(compare=False)
+    future: Future = field(compare=False)
+    batch: tuple[tuple[int, str], ...] = field(default=(), compare=False)
+
+
+class CommandQueue(QRunnable):
+    """Single owner of the instrument resource. Executes queued commands in lane priority and FIFO order."""
+
+    def __init__(self, resource, retries: int = 0):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.mutex = QMutex()
+        self.wait_condition = QWaitCondition()
+        self.resource = resource
+        self.retries = retries
+        self.active_channel = 0
+        self.running = True
+        self._pending: list[QueuedCommand] = []
+        self._sequence = count()
+
+    def submit(self, command: str, channel_id: int | None = None, is_query: bool = False,
+               lane: CommandLane = CommandLane.CONTROL) -> Future:
+        """
+        Queues the [command] to be executed on [channel_id].
+        Returns a future resolved with the query response, or None for write commands.
+        """
+        future = Future()
+        with QMutexLocker(self.mutex):
+            if not self.running:
+                future.set_exception(RuntimeError("Command queue is stopped."))
+                return future
+            heapq.heappush(self._pending,
+                           QueuedCommand(lane, next(self._sequence), command, channel_id, is_query, future))
+            self.wait_condition.wakeOne()
+        return future
+
+    def submit_batch(self, queries: list[tuple[int, str]], lane: CommandLane = CommandLane.MONITOR) -> Future:
+        """
+        Queues the (channel_id, query) pairs to be sent as a single compound SCPI line.
+        Returns a future resolved with the list of responses, in the same order as [queries].
+        """
+        future = Future()
+        with QMutexLocker(self.mutex):
+            if not self.running:
+                future.set_exception(RuntimeError("Command queue is stopped."))
+                return future
+            heapq.heappush(self._pending,
+                           QueuedCommand(lane, next(self._sequence), "", None, True, future, tuple(queries)))
+            self.wait_condition.wakeOne()
+        return future
+
+    def run(self) -> None:
+        """Executes the pending commands until [stop()] is called and the queue is drained."""
+        while True:
+            self.mutex.lock()
+            while self.running and not self._pending:
+                self.wait_condition.wait(self.mutex)
+            if not self._pending:
+                self.mutex.unlock()
+                break
+            queued = heapq.heappop(self._pending)
+            self.mutex.unlock()
+
+            self._execute(queued)
+
+    def _execute(self, queued: QueuedCommand) -> None:
+        """Selects the command channel only when it differs from the active one, then sends the command."""
+        if not queued.future.set_running_or_notify_cancel():
+            return
+        if queued.batch:
+            self._execute_batch(queued)
+            return
+        try:
+            if queued.channel_id is not None and queued.channel_id != self.active_channel:
+                self._transfer(f"{SELECT_CHANNEL}{queued.channel_id}", False)
+                self.active_channel = queued.channel_id
+
+            response = self._transfer(queued.command, queued.is_query)
+
+            if queued.command == RESET:
+                self.active_channel = 0
+            queued.future.set_result(response)
+        except Exception as error:
+            self.active_channel = 0
+            queued.future.set_exception(error)
+
+    def _execute_batch(self, queued: QueuedCommand) -> None:
+        """Joins the batch queries and its channel selects in one line and splits the compound response."""
+        try:
+            parts = []
+            channel = self.active_channel
+            for channel_id, command in queued.batch:
+                if channel_id != channel:
+                    parts.append(f"{SELECT_CHANNEL}{channel_id}")
+                    channel = channel_id
+                parts.append(command)
+
+            response = self._transfer(COMMAND_SEPARATOR.join(parts), True, f"BATCH[{len(queued.batch)}]")
+            self.active_channel = channel
+            values = [value.strip() for value in response.strip().split(RESPONSE_SEPARATOR)]
+            if len(values) != len(queued.batch):
+                raise ValueError(f"Expected {len(queued.batch)} values in the response, got {len(values)}.")
+            queued.future.set_result(values)
+        except Exception as error:
+            self.active_channel = 0
+            queued.future.set_exception(error)
+
+    def _transfer(self, command: str, is_query: bool, metrics_name: str | None = None) -> str | None:
+        """Writes or queries [command] on the resource, retrying timed out queries up to [retries] times."""
+        metrics_name = metrics_name or command_name(command)
+        attempt = 0
+        while True:
+            started = perf_counter() if io_metrics.enabled else 0.0
+            try:
+                if is_query:
+                    response = self.resource.query(command)
+                else:
+                    self.resource.write(command)
+                    response = None
+            except VisaIOError as error:
+                timeout = error.error_code == VI_ERROR_TMO
+                if io_metrics.enabled:
+                    io_metrics.record(METRICS_DEVICE, metrics_name, perf_counter() - started, timeout, not timeout)
+                if not timeout or not is_query or attempt >= self.retries:
+                    raise
+                attempt += 1
+                if io_metrics.enabled:
+                    io_metrics.record_retry(METRICS_DEVICE, metrics_name)
+                self.resource.clear()
+                continue
+
+            if io_metrics.enabled:
+                io_metrics.record(METRICS_DEVICE, metrics_name, perf_counter() - started)
+            return response
+
+    def stop(self) -> None:
+        """Stops accepting commands. The already queued ones are still executed."""
+        with QMutexLocker(self.mutex):
+            self.running = False
+            self.wait_condition.wakeAll()
@@ -1,28 +1,93 @@
+import json
+from dataclasses import asdict
+
 from PySide6.QtCore import QSettings
 
+from models.station_profile_model import StationProfile
+
 from utils.constants import *
 
 
 class ConfigManager:
+    # Values set with [override()] take precedence over the stored settings for the running process only.
+    overrides: dict = {}
+
     def __init__(self):
         self.settings = QSettings("CEBRA", "IT8700")
         self.defaults = {
             TEST_FILES_DIR: "",
             SAT_RESOURCE_PATH: "ASRL/dev/ttyUSB0::INSTR",
             SAT_BAUD_RATE: 115200,
+            SAT_SETTLE_TIME: 100,
+            SAT_SETTLE_MODE: "timed",
+            SAT_TIMEOUT: 2000,
+            SAT_QUERY_RETRIES: 1,
             ARDUINO_RESOURCE_PATH: "ASRL/dev/ttyACM0::INSTR",
             ARDUINO_SERIAL_PORT: "/dev/ttyACM0",
             ARDUINO_BAUD_RATE: 9600,
+            ARDUINO_BULK_WRITE: False,
+            ARDUINO_BREAK_TIME: 20,
+            ARDUINO_RELAY_SETTLE_TIMES: "{}",
+            STEP_ORDER_OPTIMIZATION: True,
+            SETTLING_SLOPE_THRESHOLD: 0.05,
+            SETTLING_DWELL_TIME: 500,
+            RECORDING_ENABLED: False,
+            SHORT_TEST_SAMPLE_INTERVAL: 20,
+            SHORT_TEST_TIMEOUT: 10000,
+            IO_METRICS_ENABLED: False,
+            STATION_PROFILES: "[]",
+            STATION_PROCESS_ISOLATION: False,
+            SIMULATION_ENABLED: False,
+            SIMULATION_LATENCY: 5,
+            SIMULATION_PSU_VOLTAGE: 12.0,
+            SIMULATION_PSU_CURRENT_LIMIT: 3.0,
+            SIMULATION_PSU_RECOVERY_TIME: 50,
         }
 
     def get(self, key):
         """Gets the value of a setting. If it does not exist, returns the default value defined in the [self.defaults] dictionary."""
+        if key in ConfigManager.overrides:
+            return ConfigManager.overrides[key]
         return self.settings.value(key, self.defaults.get(key))
 
+    def get_bool(self, key) -> bool:
+        """Gets a boolean setting. QSettings may return booleans as the strings 'true'/'false'."""
+        value = self.get(key)
+        if isinstance(value, str):
+            return value.lower() in ("true", "1")
+        return bool(value)
+
     def set(self, key, value):
         """Sets a value for a setting."""
         self.settings.setValue(key, value)
 
+    def get_relay_settle_times(self) -> dict[int, int]:
+        """Gets the settle time (ms) of each relay output pin, [ARDUINO_RELAY_SETTLE_TIME] if not configured."""
+        settle_times = json.loads(self.get(ARDUINO_RELAY_SETTLE_TIMES) or "{}")
+        return {pin: int(settle_times.get(str(pin), ARDUINO_RELAY_SETTLE_TIME)) for pin in ARDUINO_OUTPUT_PINS
+                if pin != ARDUINO_BUZZER_PIN}
+
+    def get_default_station_profile(self) -> StationProfile:
+        """Builds the single station profile of the global instrument settings."""
+        return StationProfile(name="Station 1", sat_resource_path=self.get(SAT_RESOURCE_PATH),
+                              arduino_resource_path=self.get(ARDUINO_RESOURCE_PATH),
+                              arduino_serial_port=self.get(ARDUINO_SERIAL_PORT))
+
+    def get_station_profiles(self) -> list[StationProfile]:
+        """Gets the configured station profiles. Without any, returns the [get_default_station_profile()] only."""
+        profiles = [StationProfile(**profile) for profile in json.loads(self.get(STATION_PROFILES) or "[]")]
+        return profiles or [self.get_default_station_profile()]
+
+    @staticmethod
+    def dump_station_profiles(profiles: list[StationProfile]) -> str:
+        """Serializes [profiles] to the JSON string stored in the [STATION_PROFILES] setting."""
+        return json.dumps([asdict(profile) for profile in profiles])
+
+    @staticmethod
+    def override(key, value):
+        """Overrides a setting for the running process without persisting it (e.g. for headless runs)."""
+        ConfigManager.overrides[key] = value
+
     def list_configs(self):
         """Lists all stored settings."""
         self.settings.sync()
@@ -2,12 +2,37 @@
 TEST_FILES_DIR: str = 'test_files_dir'
 SAT_RESOURCE_PATH: str = 'sat_resource_path'
 SAT_BAUD_RATE: str = 'sat_baud_rate'
+SAT_SETTLE_TIME: str = 'sat_settle_time'
+SAT_SETTLE_MODE: str = 'sat_settle_mode'
+SAT_TIMEOUT: str = 'sat_timeout'
+SAT_QUERY_RETRIES: str = 'sat_query_retries'
 ARDUINO_RESOURCE_PATH: str = 'arduino_resource_path'
 ARDUINO_SERIAL_PORT: str = 'arduino_serial_port'
 ARDUINO_BAUD_RATE: str = 'arduino_baud_rate'
+ARDUINO_BULK_WRITE: str = 'arduino_bulk_write'
+ARDUINO_BREAK_TIME: str = 'arduino_break_time'
+ARDUINO_RELAY_SETTLE_TIMES: str = 'arduino_relay_settle_times'
+STEP_ORDER_OPTIMIZATION: str = 'step_order_optimization'
+SETTLING_SLOPE_THRESHOLD: str = 'settling_slope_threshold'
+SETTLING_DWELL_TIME: str = 'settling_dwell_time'
+RECORDING_ENABLED: str = 'recording_enabled'
+SHORT_TEST_SAMPLE_INTERVAL: str = 'short_test_sample_interval'
+SHORT_TEST_TIMEOUT: str = 'short_test_timeout'
+IO_METRICS_ENABLED: str = 'io_metrics_enabled'
+STATION_PROFILES: str = 'station_profiles'
+STATION_PROCESS_ISOLATION: str = 'station_process_isolation'
+SIMULATION_ENABLED: str = 'simulation_enabled'
+SIMULATION_LATENCY: str = 'simulation_latency'
+SIMULATION_PSU_VOLTAGE: str = 'simulation_psu_voltage'
+SIMULATION_PSU_CURRENT_LIMIT: str = 'simulation_psu_current_limit'
+SIMULATION_PSU_RECOVERY_TIME: str = 'simulation_psu_recovery_time'
 
 # CONSTANTS
 ARDUINO_READ_TIMEOUT: int = 5
+ARDUINO_BUZZER_PIN: int = 10
+ARDUINO_BUZZER_PULSE_TIME: int = 500
+ARDUINO_RELAY_SETTLE_TIME: int = 1000
+SETTLE_MODES: list[str] = ["timed", "opc"]
 ARDUINO_OUTPUT_PINS: dict[int, str] = {
     4: "CA1",
     5: "CA2",
@@ -23,3 +48,4 @@ STEP_TYPES_MAP: dict[int, str] = {
     3: "Automatic Short",
 }
 AVAILABLE_CHANNELS: list[int] = [1, 3, 4]
+VALIDATION_MODES: tuple[str, ...] = ("snapshot", "statistical")
@@ -0,0 +1,89 @@
+import math
+from abc import ABC, abstractmethod
+
+COARSE_DIVISIONS = 8
+
+
+class CurrentLimitSearch(ABC):
+    """
+    Searches the lowest load, on a [resolution] grid starting at [lower], where the output voltage drops.
+    Loads are handled as grid indexes to avoid float drift.
+    A limit above [upper] means the voltage never dropped inside the range.
+    """
+
+    def __init__(self, lower: float, upper: float, resolution: float):
+        self.lower = lower
+        self.resolution = resolution
+        self.max_index = math.floor((upper - lower) / resolution + 1e-9)
+        self.index = 0
+        self.limit: float | None = None
+
+    @property
+    def load(self) -> float:
+        return self._load_at(self.index)
+
+    @property
+    def done(self) -> bool:
+        return self.limit is not None
+
+    @abstractmethod
+    def next_load(self, voltage_ok: bool) -> float | None:
+        """Receives the verdict for the current [load] and returns the next one, or None once the limit is found."""
+
+    def _load_at(self, index: int) -> float:
+        return round(self.lower + index * self.resolution, 6)
+
+
+class LinearSearch(CurrentLimitSearch):
+    """Increases the load by one [resolution] step per reading."""
+
+    def next_load(self, voltage_ok: bool) -> float | None:
+        if voltage_ok and self.index <= self.max_index:
+            self.index += 1
+            return self.load
+
+        self.limit = self.load
+        return None
+
+
+class BisectionSearch(CurrentLimitSearch):
+    """Ramps the load in coarse steps until the voltage drops, then bisects down to [resolution]."""
+
+    def __init__(self, lower: float, upper: float, resolution: float):
+        super().__init__(lower, upper, resolution)
+        self.stride = max(1, round(self.max_index / COARSE_DIVISIONS))
+        self.passing_index: int | None = None
+        self.failing_index: int | None = None
+
+    def next_load(self, voltage_ok: bool) -> float | None:
+        if voltage_ok:
+            self.passing_index = self.index
+        else:
+            self.failing_index = self.index
+
+        if self.failing_index is None:
+            if self.index > self.max_index:
+                self.limit = self.load
+                return None
+            self.index = min(self.index + self.stride, self.max_index + 1)
+            return self.load
+
+        if self.passing_index is None or self.failing_index - self.passing_index <= 1:
+            self.limit = self._load_at(self.failing_index)
+            return None
+
+        self.index = (self.passing_index + self.failing_index) // 2
+        return self.load
+
+
+SEARCH_STRATEGIES: dict[str, type[CurrentLimitSearch]] = {
+    "linear": LinearSearch,
+    "bisection": BisectionSearch,
+}
+
+
+def create_current_limit_search(strategy: str, lower: float, upper: float, resolution: float) -> CurrentLimitSearch:
+    """Creates the search object for the [strategy] name used in the test file."""
+    if strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f"Unknown current limit search strategy: {strategy}")
+    return SEARCH_STRATEGIES[strategy](lower, upper, resolution)
@@ -1,4 +1,9 @@
-from PySide6.QtCore import QObject, Signal, QTimer
+import math
+from time import monotonic
+
+from PySide6.QtCore import QObject, Signal, QTimer, Qt
+
+DISPLAY_TICK_INTERVAL = 250
 
 
 class DelayManager(QObject):
@@ -9,27 +14,72 @@ class DelayManager(QObject):
         super().__init__()
         self.remaining_time = 0
         self.paused = False
+        self.active = False
+        self.deadline = 0.0
+
+        self.completion_timer = QTimer(self)
+        self.completion_timer.setSingleShot(True)
+        self.completion_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.completion_timer.timeout.connect(self._on_completion_timeout)
+        self.display_timer = QTimer(self)
+        self.display_timer.setInterval(DISPLAY_TICK_INTERVAL)
+        self.display_timer.timeout.connect(self._emit_remaining_time)
 
     def start_delay(self, delay: float) -> None:
-        """Starts the delay with the given [delay]."""
+        """Starts the delay with the given [delay] in milliseconds."""
         self.remaining_time = delay
-        self._run_timer()
+        self.paused = False
+        self.active = True
+        self._start_timers()
 
     def pause_resume(self) -> None:
-        """Toggles between pausing and resuming the timer."""
+        """Toggles between pausing and resuming the timer, keeping the exact remaining time."""
+        if not self.active:
+            return
         if self.paused:
             self.paused = False
-            self._run_timer()
+            self._start_timers()
         else:
             self.paused = True
+            self.remaining_time = self._get_remaining_time()
+            self._stop_timers()
+            self.remaining_time_changed.emit(self.remaining_time)
 
-    def _run_timer(self) -> None:
-        """Runs the internal timer recursively every 100ms."""
-        if self.paused:
+    def cancel(self) -> None:
+        """Stops the delay without emitting [delay_completed]."""
+        self._stop_timers()
+        self.active = False
+        self.paused = False
+        self.remaining_time = 0
+
+    def finish(self) -> None:
+        """Ends the delay before its deadline, emitting [delay_completed]."""
+        self.cancel()
+        self.remaining_time_changed.emit(0)
+        self.delay_completed.emit()
+
+    def _start_timers(self) -> None:
+        """Sets the deadline on the monotonic clock and arms the completion and display timers."""
+        self.deadline = monotonic() + self.remaining_time / 1000
+        self.completion_timer.start(math.ceil(self.remaining_time))
+        self.display_timer.start()
+        self._emit_remaining_time()
+
+    def _stop_timers(self) -> None:
+        self.completion_timer.stop()
+        self.display_timer.stop()
+
+    def _get_remaining_time(self) -> int:
+        """Returns the milliseconds left until the deadline."""
+        return max(0, math.ceil((self.deadline - monotonic()) * 1000))
+
+    def _emit_remaining_time(self) -> None:
+        self.remaining_time_changed.emit(self._get_remaining_time())
+
+    def _on_completion_timeout(self) -> None:
+        """Emits [delay_completed] once the deadline is reached, re-arming the timer if it fired early."""
+        remaining_time = self._get_remaining_time()
+        if remaining_time > 0:
+            self.completion_timer.start(remaining_time)
             return
-        if self.remaining_time > 0:
-            self.remaining_time -= 100
-            self.remaining_time_changed.emit(self.remaining_time)
-            QTimer.singleShot(100, self._run_timer)
-        else:
-            self.delay_completed.emit()
+        self.finish()
@@ -0,0 +1,211 @@
+import re
+from dataclasses import dataclass
+from time import monotonic, sleep
+
+from utils.config_manager import ConfigManager
+from utils.constants import SIMULATION_LATENCY, SIMULATION_PSU_VOLTAGE, SIMULATION_PSU_CURRENT_LIMIT, \
+    SIMULATION_PSU_RECOVERY_TIME
+from utils.scpi_commands import *
+
+SIMULATED_INST_ID = "ITECH Ltd.,IT8700 SIMULATOR,000000000000,1.0"
+ARDUINO_FRAME_TIMEOUT = 0.005
+ARDUINO_MAX_BREAK_TIME = 5000
+
+
+@dataclass
+class PsuModel:
+    """Output behaviour of the simulated unit under test, the same for every channel."""
+    nominal_voltage: float = 12.0
+    output_resistance: float = 0.05
+    current_limit: float = 3.0
+    foldback_ratio: float = 0.5
+    shutdown_time: float = 0.005
+    recovery_time: float = 0.05
+
+
+@dataclass
+class SimulatedChannel:
+    load: float = 0.0
+    input_on: bool = False
+    short: bool = False
+    short_changed: float = 0.0
+
+    def voltage(self, model: PsuModel) -> float:
+        elapsed = monotonic() - self.short_changed
+        if self.short:
+            return 0.0 if elapsed >= model.shutdown_time else model.nominal_voltage
+        if elapsed < model.recovery_time:
+            return 0.0
+
+        load = self.current()
+        if load > model.current_limit:
+            return round(model.nominal_voltage * model.foldback_ratio, 4)
+        return round(model.nominal_voltage - load * model.output_resistance, 4)
+
+    def current(self) -> float:
+        return self.load if self.input_on and not self.short else 0.0
+
+
+class SimulatedIT8700:
+    """
+    Drop-in replacement of the pyvisa resource of the IT8700, answering the commands of [scpi_commands].
+    Every transaction waits [latency] seconds and is counted with its bytes on the wire.
+    """
+
+    def __init__(self, model: PsuModel, latency: float = 0.0):
+        self.model = model
+        self.latency = latency
+        self.baud_rate = 0
+        self.channels: dict[int, SimulatedChannel] = {}
+        self.active_channel = 1
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def write(self, command: str) -> None:
+        self._transaction(command)
+        self._execute(command)
+
+    def query(self, command: str) -> str:
+        self._transaction(command)
+        response = RESPONSE_SEPARATOR.join(value for value in self._execute(command) if value is not None) + "\n"
+        self.bytes_read += len(response)
+        return response
+
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _transaction(self, command: str) -> None:
+        self.transactions += 1
+        self.bytes_written += len(command) + 1
+        if self.latency:
+            sleep(self.latency)
+
+    def _execute(self, command: str) -> list[str | None]:
+        return [self._execute_single(part.strip().lstrip(":")) for part in command.split(RESPONSE_SEPARATOR)]
+
+    def _execute_single(self, command: str) -> str | None:
+        channel = self.channels.setdefault(self.active_channel, SimulatedChannel())
+        if command.startswith(SELECT_CHANNEL):
+            self.active_channel = int(command[len(SELECT_CHANNEL):])
+        elif command.startswith(SET_CURR):
+            channel.load = float(command[len(SET_CURR):])
+        elif command in (INPUT_ON, INPUT_OFF):
+            channel.input_on = command == INPUT_ON
+        elif command in (ALL_INPUTS_ON, ALL_INPUTS_OFF):
+            for item in self.channels.values():
+                item.input_on = command == ALL_INPUTS_ON
+        elif command in (SHORT_ON, SHORT_OFF):
+            channel.short = command == SHORT_ON
+            channel.short_changed = monotonic()
+        elif command == RESET:
+            self.channels.clear()
+            self.active_channel = 1
+        elif command == FETCH_VOLT:
+            return "%.4f" % channel.voltage(self.model)
+        elif command == FETCH_CURR:
+            return "%.4f" % channel.current()
+        elif command == INST_ID:
+            return SIMULATED_INST_ID
+        elif command == OPERATION_COMPLETE:
+            return "1"
+        return None
+
+
+class SimulatedArduinoSerial:
+    """
+    Fake serial endpoint for the [WD]/[WP]/[RD]/[M] protocol of [Arduino], framing the received bytes like the
+    firmware: a frame ends with '\n' or after [ARDUINO_FRAME_TIMEOUT] without new bytes, so unterminated frames
+    written back to back are merged and parsed as the first one.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.timeout = None
+        self.pins: dict[int, int] = {}
+        self.pin_modes: dict[int, str] = {}
+        # (monotonic time, pin, value) of every output change, to check the relay timings.
+        self.pin_changes: list[tuple[float, int, int]] = []
+        self.transactions = 0
+        self.bytes_written = 0
+        self._responses: list[bytes] = []
+        self._frame = ""
+        self._last_received = 0.0
+
+    def write(self, data: bytes) -> int:
+        written = monotonic()
+        self.transactions += 1
+        self.bytes_written += len(data)
+        if self._frame and written - self._last_received >= ARDUINO_FRAME_TIMEOUT:
+            self._end_frame()
+        if self.latency:
+            sleep(self.latency)
+
+        self._frame += data.decode()
+        while "\n" in self._frame:
+            frame, self._frame = self._frame.split("\n", 1)
+            self._handle_frame(frame.strip())
+        self._last_received = monotonic()
+        return len(data)
+
+    def readline(self) -> bytes:
+        # The firmware handles an unterminated frame once the line is idle, well within the read timeout.
+        if self._frame:
+            self._end_frame()
+        return self._responses.pop(0) if self._responses else b""
+
+    def _end_frame(self) -> None:
+        frame, self._frame = self._frame, ""
+        self._handle_frame(frame.strip())
+
+    def _handle_frame(self, frame: str) -> None:
+        """Parses [frame] like the firmware, which reads the leading digits of each field (String.toInt())."""
+        if frame.startswith("WP"):
+            pins_mask, _, break_time = frame[2:].partition(":")
+            pins_mask, break_time = _to_int(pins_mask), _to_int(break_time)
+            for pin in list(self.pins):
+                if not pins_mask >> pin & 1:
+                    self._set_pin(pin, 0)
+            sleep(min(break_time, ARDUINO_MAX_BREAK_TIME) / 1000)
+            for pin in range(pins_mask.bit_length()):
+                if pins_mask >> pin & 1:
+                    self._set_pin(pin, 1)
+            self._responses.append(f"P:{pins_mask}\r\n".encode())
+        elif frame.startswith("WD"):
+            pin, _, value = frame[2:].partition(":")
+            self._set_pin(_to_int(pin), 1 if _to_int(value) else 0)
+        elif frame.startswith("RD"):
+            pin = _to_int(frame[2:])
+            self._responses.append(f"D{pin}:{self.pins.get(pin, 0)}\r\n".encode())
+        elif frame.startswith("M") and len(frame) > 2:
+            self.pin_modes[_to_int(frame[2:])] = frame[1]
+
+    def _set_pin(self, pin: int, value: int) -> None:
+        if self.pins.get(pin, 0) != value:
+            self.pin_changes.append((monotonic(), pin, value))
+        self.pins[pin] = value
+
+    def close(self) -> None:
+        pass
+
+
+def _to_int(text: str) -> int:
+    """Returns the leading integer of [text], 0 if there is none, like the String.toInt() of the firmware."""
+    match = re.match(r"\s*-?\d+", text)
+    return int(match.group()) if match else 0
+
+
+def build_psu_model(config: ConfigManager) -> PsuModel:
+    """Creates the simulated unit model from the [SIMULATION_*] settings."""
+    return PsuModel(
+        nominal_voltage=float(config.get(SIMULATION_PSU_VOLTAGE)),
+        current_limit=float(config.get(SIMULATION_PSU_CURRENT_LIMIT)),
+        recovery_time=int(config.get(SIMULATION_PSU_RECOVERY_TIME)) / 1000,
+    )
+
+
+def get_simulation_latency(config: ConfigManager) -> float:
+    return int(config.get(SIMULATION_LATENCY)) / 1000
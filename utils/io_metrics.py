@@ -0,0 +1,111 @@
+import bisect
+import csv
+import json
+from dataclasses import dataclass, field, asdict
+
+from PySide6.QtCore import QMutex, QMutexLocker
+
+HISTOGRAM_BOUNDS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+@dataclass
+class CommandMetrics:
+    device: str
+    command: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    timeouts: int = 0
+    retries: int = 0
+    errors: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS) + 1))
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def percentile(self, ratio: float) -> float:
+        """Returns the upper bound (ms) of the histogram bucket holding the [ratio] percentile."""
+        target = self.count * ratio
+        accumulated = 0
+        for index, bucket_count in enumerate(self.histogram):
+            accumulated += bucket_count
+            if accumulated >= target and bucket_count:
+                return HISTOGRAM_BOUNDS[index] if index < len(HISTOGRAM_BOUNDS) else self.max_time
+        return 0.0
+
+
+def command_name(command: str) -> str:
+    """Removes the arguments from [command], so 'CURR 1.5' and 'CURR 2' are counted together."""
+    return command.split(" ")[0]
+
+
+class IoMetrics:
+    """
+    Process-wide latency histograms, counts, timeouts and retries of the instrument transactions.
+    When disabled, callers only pay for the [enabled] check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.mutex = QMutex()
+        self.metrics: dict[tuple[str, str], CommandMetrics] = {}
+
+    def record(self, device: str, command: str, elapsed: float, timeout: bool = False, error: bool = False) -> None:
+        """Records one transaction of [command] on [device] that took [elapsed] seconds."""
+        elapsed_ms = elapsed * 1000
+        with QMutexLocker(self.mutex):
+            metrics = self._get_metrics(device, command)
+            metrics.count += 1
+            metrics.total_time += elapsed_ms
+            metrics.max_time = max(metrics.max_time, elapsed_ms)
+            metrics.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS, elapsed_ms)] += 1
+            metrics.timeouts += timeout
+            metrics.errors += error
+
+    def record_retry(self, device: str, command: str) -> None:
+        with QMutexLocker(self.mutex):
+            self._get_metrics(device, command).retries += 1
+
+    def snapshot(self) -> list[CommandMetrics]:
+        """Returns a copy of the current metrics, sorted by device and command."""
+        with QMutexLocker(self.mutex):
+            return [CommandMetrics(**asdict(metrics)) for _, metrics in sorted(self.metrics.items())]
+
+    def reset(self) -> None:
+        with QMutexLocker(self.mutex):
+            self.metrics.clear()
+
+    def export(self, file_path: str) -> None:
+        """Writes the metrics to [file_path], as CSV if the extension is .csv, else as JSON."""
+        snapshot = self.snapshot()
+        with open(file_path, "w", encoding="utf-8", newline="") as file:
+            if file_path.lower().endswith(".csv"):
+                writer = csv.writer(file)
+                writer.writerow(["device", "command", "count", "mean_ms", "p95_ms", "max_ms", "timeouts", "retries",
+                                 "errors", *[f"le_{bound}ms" for bound in HISTOGRAM_BOUNDS], "inf"])
+                for metrics in snapshot:
+                    writer.writerow([metrics.device, metrics.command, metrics.count, round(metrics.mean_time, 3),
+                                     metrics.percentile(0.95), round(metrics.max_time, 3), metrics.timeouts,
+                                     metrics.retries, metrics.errors, *metrics.histogram])
+            else:
+                json.dump({"histogram_bounds_ms": HISTOGRAM_BOUNDS,
+                           "commands": [asdict(metrics) for metrics in snapshot]}, file, indent=2)
+
+    def format_table(self) -> str:
+        """Formats the metrics as a fixed width text table for the diagnostics panel."""
+        lines = [f"{'DEVICE':<8}{'COMMAND':<14}{'COUNT':>8}{'MEAN':>9}{'P95':>8}{'MAX':>9}{'TMO':>5}{'RETRY':>6}"]
+        for metrics in self.snapshot():
+            lines.append(f"{metrics.device:<8}{metrics.command[:13]:<14}{metrics.count:>8}{metrics.mean_time:>9.2f}"
+                         f"{metrics.percentile(0.95):>8.0f}{metrics.max_time:>9.2f}{metrics.timeouts:>5}"
+                         f"{metrics.retries:>6}")
+        return "\n".join(lines)
+
+    def _get_metrics(self, device: str, command: str) -> CommandMetrics:
+        key = (device, command)
+        if key not in self.metrics:
+            self.metrics[key] = CommandMetrics(device, command)
+        return self.metrics[key]
+
+
+io_metrics = IoMetrics()
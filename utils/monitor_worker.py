@@ -1,19 +1,27 @@
-from time import sleep
+from time import sleep, monotonic
 
+from pyvisa import VisaIOError
 from PySide6.QtCore import QRunnable, QMutex, QWaitCondition, QMutexLocker
 
+from models.channel_sample_model import ChannelSample
+
+MONITOR_INTERVAL = 0.1
+
 
 class MonitorWorker(QRunnable):
-    def __init__(self, signals):
+    def __init__(self, signals, electronic_load_controller, channel_ids: list[int]):
         super().__init__()
         self.mutex = QMutex()
         self.wait_condition = QWaitCondition()
         self.signals = signals
+        self.electronic_load_controller = electronic_load_controller
+        self.channel_ids = tuple(channel_ids)
+        self.interval = MONITOR_INTERVAL
         self.paused = False
         self.running = True
 
     def run(self) -> None:
-        """Emits the [update_output] signal every 100ms, as long as the worker is running."""
+        """Reads every channel and emits the [update_output] signal with the sample batch every [interval]."""
         while self.running:
             self.mutex.lock()
             while self.paused:
@@ -22,8 +30,28 @@ class MonitorWorker(QRunnable):
                 )
             self.mutex.unlock()
 
-            self.signals.update_output.emit()
-            sleep(0.1)
+            if not self.running:
+                break
+            samples = self._read_samples()
+            if samples:
+                self.signals.update_output.emit(samples)
+            sleep(self.interval)
+
+    def _read_samples(self) -> tuple[ChannelSample, ...]:
+        """Reads all monitored channels in a single transaction and returns an immutable batch."""
+        timestamp = monotonic()
+        try:
+            values = self.electronic_load_controller.get_channels_values(list(self.channel_ids))
+        except (RuntimeError, ValueError, VisaIOError):
+            return ()
+        if not values:
+            return ()
+        return tuple(ChannelSample(channel_id, timestamp, voltage, current)
+                     for channel_id, (voltage, current) in values.items())
+
+    def set_interval(self, interval: float) -> None:
+        """Changes the scan [interval] in seconds, applied from the next scan."""
+        self.interval = interval
 
     def pause(self) -> None:
         """Pauses the execution of the worker. The thread sleeps until [resume()] is called."""
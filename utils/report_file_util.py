@@ -23,6 +23,7 @@ def generate_report_file(data: dict):
     voltage_upper_line = ""
     voltage_lower_line = ""
     power_line = ""
+    ripple_line = ""
     voltage_output_line = ""
     under_voltage_line = ""
     load_upper_line = ""
@@ -31,6 +32,8 @@ def generate_report_file(data: dict):
     voltage_ref_line = ""
     shutdown_line = ""
     recovery_line = ""
+    shutdown_time_line = ""
+    recovery_time_line = ""
     short_load_line = ""
 
     # Write
@@ -58,6 +61,7 @@ def generate_report_file(data: dict):
                 voltage_lower_line = "|Lower: " + " " * 7
                 voltage_output_line = "|Outcome: " + " " * 5
                 power_line = "|Power: " + " " * 7
+                ripple_line = "|Ripple: " + " " * 6
                 for channel in step["channels_data"]:
                     static_load = str(channel["load"])
                     voltage_upper = str(channel["upper_voltage"])
@@ -77,6 +81,8 @@ def generate_report_file(data: dict):
                         f"[ {voltage_output + ' ' * (8 - len(voltage_output))}]V "
                     )
                     power_line += f"[ {power + ' ' * (8 - len(power))}]W "
+                    ripple = "-" if channel.get("ripple") is None else "%.3f" % channel["ripple"]
+                    ripple_line += f"[ {ripple + ' ' * (8 - len(ripple))}]V "
             case 2:
                 channels_line = "|" + "=" * 15
                 under_voltage_line = "|Under Voltage: "
@@ -101,17 +107,23 @@ def generate_report_file(data: dict):
                 voltage_ref_line = "|Voltage Ref. : "
                 shutdown_line = "|Shutdown: " + " " * 5
                 recovery_line = "|Recovery: " + " " * 5
+                shutdown_time_line = "|Shutdown (ms): "
+                recovery_time_line = "|Recovery (ms): "
                 short_load_line = "|Load: " + " " * 9
                 for channel in step["channels_data"]:
                     voltage_ref = str(channel["voltage_ref"])
                     shutdown = "PASS" if channel["shutdown"] else "FAIL"
                     recovery = "PASS" if channel["recovery"] else "FAIL"
+                    shutdown_time = format_elapsed_ms(channel.get("shutdown_time"))
+                    recovery_time = format_elapsed_ms(channel.get("recovery_time"))
                     load = str(channel["load"])
 
                     channels_line += f"[Channel {channel['channel_id']}]=="
                     voltage_ref_line += f"[ {voltage_ref + ' ' * (8 - len(voltage_ref))}]V "
                     shutdown_line += f"[ {shutdown + ' ' * (8 - len(shutdown))}]  "
                     recovery_line += f"[ {recovery + ' ' * (8 - len(recovery))}]  "
+                    shutdown_time_line += f"[ {shutdown_time + ' ' * (8 - len(shutdown_time))}]  "
+                    recovery_time_line += f"[ {recovery_time + ' ' * (8 - len(recovery_time))}]  "
                     short_load_line += f"[ {load + ' ' * (8 - len(load))}]A "
 
         lines.append(f"{channels_line + '=' * (68 - len(channels_line))}|\n")
@@ -122,6 +134,10 @@ def generate_report_file(data: dict):
                 lines.append(format_line(voltage_lower_line))
                 lines.append(format_line(voltage_output_line))
                 lines.append(format_line(power_line))
+                if any("ripple" in channel for channel in step["channels_data"]):
+                    lines.append(format_line(ripple_line))
+                if step.get("step_time") is not None:
+                    lines.append(format_line(f"|Step Time:    [ {'%.2f' % step['step_time']}s of {step['duration']}s ]"))
             case 2:
                 lines.append(format_line(under_voltage_line))
                 lines.append(format_line(load_upper_line))
@@ -131,6 +147,8 @@ def generate_report_file(data: dict):
                 lines.append(format_line(voltage_ref_line))
                 lines.append(format_line(shutdown_line))
                 lines.append(format_line(recovery_line))
+                lines.append(format_line(shutdown_time_line))
+                lines.append(format_line(recovery_time_line))
                 lines.append(format_line(short_load_line))
 
         temp_file.writelines(lines)
@@ -145,3 +163,7 @@ def generate_report_file(data: dict):
 
 def format_line(text: str) -> str:
     return f"{text + ' ' * (68 - len(text))}|\n"
+
+
+def format_elapsed_ms(seconds: float | None) -> str:
+    return "-" if seconds is None else "%.0f" % (seconds * 1000)
@@ -0,0 +1,123 @@
+import math
+
+import numpy as np
+
+from models.channel_sample_model import ChannelSample
+
+SAMPLE_HISTORY_CAPACITY = 4096
+TIMESTAMP, VOLTAGE, CURRENT, POWER = range(4)
+
+
+def least_squares_slope(timestamps: np.ndarray, values: np.ndarray) -> float:
+    """Returns the least squares slope (units per second) of [values], NaN if undefined."""
+    if timestamps.size < 2:
+        return math.nan
+    elapsed = timestamps - timestamps.mean()
+    variance = np.dot(elapsed, elapsed)
+    if variance == 0:
+        return math.nan
+    return float(np.dot(elapsed, values - values.mean()) / variance)
+
+
+class ChannelHistory:
+    """
+    Fixed-size history of the samples of one channel, stored as (timestamp, voltage, current, power) columns of a
+    preallocated NumPy array. Every sample is written twice, at [index] and [index + capacity], so the latest
+    samples are always a contiguous view and the window queries never copy or allocate the buffer.
+    A missing current is stored as NaN and ignored by the statistics.
+    """
+
+    def __init__(self, channel_id: int, capacity: int = SAMPLE_HISTORY_CAPACITY):
+        self.channel_id = channel_id
+        self.capacity = capacity
+        self.data = np.zeros((4, 2 * capacity), dtype=np.float64)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp: float, voltage: float, current: float | None) -> None:
+        """Writes a sample over the oldest one once the history is full."""
+        current = math.nan if current is None else current
+        index = self.count % self.capacity
+        for row in (index, index + self.capacity):
+            self.data[TIMESTAMP, row] = timestamp
+            self.data[VOLTAGE, row] = voltage
+            self.data[CURRENT, row] = current
+            self.data[POWER, row] = voltage * current
+        self.count += 1
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def latest(self) -> ChannelSample | None:
+        """Returns the last appended sample, None if the history is empty."""
+        if self.count == 0:
+            return None
+        timestamp, voltage, current, _ = self.data[:, (self.count - 1) % self.capacity]
+        return ChannelSample(self.channel_id, float(timestamp), float(voltage),
+                             None if math.isnan(current) else float(current))
+
+    def window(self, duration: float | None = None, end: float | None = None) -> np.ndarray:
+        """
+        Returns a (4, n) view of the samples acquired in the last [duration] seconds before [end] (the latest
+        sample if None), oldest first. Returns every stored sample if [duration] is None.
+        """
+        size = len(self)
+        stop = (self.count - 1) % self.capacity + self.capacity + 1 if size else 0
+        samples = self.data[:, stop - size:stop]
+        timestamps = samples[TIMESTAMP]
+        last = np.searchsorted(timestamps, end, side="right") if end is not None else size
+        first = np.searchsorted(timestamps, timestamps[last - 1] - duration, side="left") \
+            if duration is not None and last > 0 else 0
+        return samples[:, first:last]
+
+    def mean(self, column: int = VOLTAGE, duration: float | None = None) -> float:
+        return self._reduce(np.nanmean, column, duration)
+
+    def min(self, column: int = VOLTAGE, duration: float | None = None) -> float:
+        return self._reduce(np.nanmin, column, duration)
+
+    def max(self, column: int = VOLTAGE, duration: float | None = None) -> float:
+        return self._reduce(np.nanmax, column, duration)
+
+    def slope(self, column: int = VOLTAGE, duration: float | None = None) -> float:
+        """Returns the least squares slope (units per second) of [column] over the window, NaN if undefined."""
+        samples = self.window(duration)
+        return least_squares_slope(samples[TIMESTAMP], samples[column])
+
+    def since(self, start: float) -> np.ndarray:
+        """Returns a (4, n) view of the samples acquired from [start] on, oldest first."""
+        samples = self.window()
+        return samples[:, np.searchsorted(samples[TIMESTAMP], start, side="left"):]
+
+    def _reduce(self, function, column: int, duration: float | None) -> float:
+        values = self.window(duration)[column]
+        if values.size == 0 or np.isnan(values).all():
+            return math.nan
+        return float(function(values))
+
+
+class SampleHistory:
+    """
+    Acquisition store of a test: one [ChannelHistory] per channel, appended with each sample batch of the monitor
+    worker and shared by the sequencer and the views, so statistics over recent readings need no extra instrument
+    traffic.
+    """
+
+    def __init__(self, channel_ids: list[int], capacity: int = SAMPLE_HISTORY_CAPACITY):
+        self.channels: dict[int, ChannelHistory] = {
+            channel_id: ChannelHistory(channel_id, capacity) for channel_id in channel_ids}
+
+    def append(self, samples: tuple[ChannelSample, ...]) -> None:
+        for sample in samples:
+            history = self.channels.get(sample.channel_id)
+            if history is not None:
+                history.append(sample.timestamp, sample.voltage, sample.current)
+
+    def get(self, channel_id: int) -> ChannelHistory | None:
+        return self.channels.get(channel_id)
+
+    def clear(self) -> None:
+        for history in self.channels.values():
+            history.clear()
@@ -0,0 +1,155 @@
+import json
+from collections import deque
+from time import monotonic
+
+import numpy as np
+from PySide6.QtCore import QRunnable, QMutex, QWaitCondition, QMutexLocker
+
+from models.channel_sample_model import ChannelSample
+
+RECORDING_EXTENSION = ".it8rec"
+RECORDING_MAGIC = b"IT8700REC1\n"
+HEADER_BLOCK_SIZE = 4096
+RECORD_DTYPE = np.dtype([("timestamp", "<f8"), ("channel_id", "<u1"), ("step_id", "<i2"), ("voltage", "<f4"),
+                         ("current", "<f4")])
+CHUNK_SIZE = 1024
+MAX_CHUNKS = 16
+FLUSH_INTERVAL = 1.0
+# Widest final counts, reserved when sizing the header so it can be rewritten in place once the recording ends.
+MAX_COUNT = 2 ** 63 - 1
+
+
+def _encode_header(metadata: dict, header_size: int | None = None) -> bytes:
+    """
+    Returns the header of [metadata] padded to [header_size], by default the smallest multiple of
+    [HEADER_BLOCK_SIZE] that fits it. Raises ValueError if the metadata does not fit in [header_size].
+    """
+    header = RECORDING_MAGIC + json.dumps(metadata).encode("utf-8")
+    if header_size is None:
+        header_size = (len(header) // HEADER_BLOCK_SIZE + 1) * HEADER_BLOCK_SIZE
+    if len(header) >= header_size:
+        raise ValueError("Recording metadata does not fit in the header.")
+    return header.ljust(header_size - 1) + b"\n"
+
+
+def _read_header(file_path: str) -> tuple[dict, int]:
+    """Returns the metadata and the header size of the recording at [file_path]."""
+    with open(file_path, "rb") as file:
+        magic = file.read(len(RECORDING_MAGIC))
+        header = file.readline()
+        header_size = file.tell()
+    if magic != RECORDING_MAGIC or not header.endswith(b"\n") or header_size % HEADER_BLOCK_SIZE:
+        raise ValueError(f"{file_path} is not a sample recording.")
+    return json.loads(header.decode("utf-8")), header_size
+
+
+def read_recording_header(file_path: str) -> dict:
+    """Returns the metadata of the recording at [file_path], raising ValueError if it is not a recording."""
+    return _read_header(file_path)[0]
+
+
+def open_recording(file_path: str) -> tuple[dict, np.ndarray]:
+    """
+    Returns the metadata and a read-only memory map of the records at [file_path], ignoring a trailing partial
+    record left by an interrupted recording.
+    """
+    metadata, header_size = _read_header(file_path)
+    with open(file_path, "rb") as file:
+        file.seek(0, 2)
+        count = (file.tell() - header_size) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return metadata, np.empty(0, dtype=RECORD_DTYPE)
+    return metadata, np.memmap(file_path, dtype=RECORD_DTYPE, mode="r", offset=header_size, shape=(count,))
+
+
+class SampleRecorder(QRunnable):
+    """
+    Streams every acquired sample of a unit to an append-only file of fixed size [RECORD_DTYPE] records after a
+    JSON metadata header, readable with [open_recording()] while it is still being written, emitting
+    [recording_finished] once the file is complete.
+    [record()] only copies the samples into a preallocated chunk, the file is written by the worker thread. The
+    chunks come from a fixed pool of [MAX_CHUNKS], so if the disk falls behind the new samples are dropped and
+    counted in [dropped] instead of growing the memory or slowing the acquisition.
+    """
+
+    def __init__(self, signals, file_path: str, metadata: dict):
+        super().__init__()
+        self.signals = signals
+        self.mutex = QMutex()
+        self.wait_condition = QWaitCondition()
+        self.file_path = file_path
+        self.metadata = metadata
+        self.started = monotonic()
+        # Sized for the final counts, so the header written by [run()] always fits.
+        header = _encode_header({**metadata, "samples": MAX_COUNT, "dropped": MAX_COUNT})
+        self.header_size = len(header)
+        self.file = open(file_path, "wb")
+        try:
+            self.file.write(_encode_header(metadata, self.header_size))
+        except OSError:
+            self.file.close()
+            raise
+        self.free_chunks = [np.empty(CHUNK_SIZE, dtype=RECORD_DTYPE) for _ in range(MAX_CHUNKS)]
+        self.pending_chunks: deque[tuple[np.ndarray, int]] = deque()
+        self.chunk: np.ndarray | None = self.free_chunks.pop()
+        self.chunk_size = 0
+        self.last_flush = self.started
+        self.recorded = 0
+        self.dropped = 0
+        self.running = True
+
+    def record(self, samples: tuple[ChannelSample, ...], step_id: int) -> None:
+        """Appends [samples] acquired during the step [step_id] (-1 between steps)."""
+        for sample in samples:
+            if self.chunk is None:
+                with QMutexLocker(self.mutex):
+                    self.chunk = self.free_chunks.pop() if self.free_chunks else None
+                if self.chunk is None:
+                    self.dropped += 1
+                    continue
+            self.chunk[self.chunk_size] = (sample.timestamp - self.started, sample.channel_id, step_id,
+                                           sample.voltage, np.nan if sample.current is None else sample.current)
+            self.chunk_size += 1
+            self.recorded += 1
+            if self.chunk_size == CHUNK_SIZE:
+                self._publish_chunk()
+        if self.chunk_size and monotonic() - self.last_flush >= FLUSH_INTERVAL:
+            self._publish_chunk()
+
+    def stop(self) -> None:
+        """Hands the last samples to the worker, which writes them and closes the file."""
+        if self.chunk_size:
+            self._publish_chunk()
+        with QMutexLocker(self.mutex):
+            self.running = False
+            self.wait_condition.wakeAll()
+
+    def run(self) -> None:
+        """Writes the published chunks until [stop()], then completes the header with the final counts."""
+        while True:
+            with QMutexLocker(self.mutex):
+                while self.running and not self.pending_chunks:
+                    self.wait_condition.wait(self.mutex)
+                if not self.pending_chunks:
+                    break
+                chunk, size = self.pending_chunks.popleft()
+            self.file.write(chunk[:size].data)
+            self.file.flush()
+            with QMutexLocker(self.mutex):
+                self.free_chunks.append(chunk)
+
+        self.metadata.update(samples=self.recorded, dropped=self.dropped)
+        try:
+            self.file.seek(0)
+            self.file.write(_encode_header(self.metadata, self.header_size))
+        finally:
+            self.file.close()
+        self.signals.recording_finished.emit(self.file_path)
+
+    def _publish_chunk(self) -> None:
+        with QMutexLocker(self.mutex):
+            self.pending_chunks.append((self.chunk, self.chunk_size))
+            self.chunk = self.free_chunks.pop() if self.free_chunks else None
+            self.wait_condition.wakeAll()
+        self.chunk_size = 0
+        self.last_flush = monotonic()
@@ -0,0 +1,62 @@
+import math
+import struct
+from multiprocessing import shared_memory
+
+from models.channel_sample_model import ChannelSample
+
+SAMPLE_RING_CAPACITY = 4096
+HEADER_FORMAT = "<Q"
+SLOT_FORMAT = "<iddd"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SLOT_SIZE = struct.calcsize(SLOT_FORMAT)
+
+
+class SampleRing:
+    """
+    Single writer / single reader ring of [ChannelSample] in shared memory, used to stream the acquisition of a
+    station process to the GUI without pickling.
+    The header holds the total count of written samples; a reader that falls more than [capacity] samples behind
+    skips to the oldest sample still in the ring.
+    """
+
+    def __init__(self, name: str | None = None, capacity: int = SAMPLE_RING_CAPACITY):
+        self.capacity = capacity
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity * SLOT_SIZE)
+            struct.pack_into(HEADER_FORMAT, self.memory.buf, 0, 0)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.read_count = 0
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def write(self, samples: tuple[ChannelSample, ...]) -> None:
+        """Writes [samples] to the slots and then publishes them by updating the header count."""
+        (count,) = struct.unpack_from(HEADER_FORMAT, self.memory.buf, 0)
+        for sample in samples:
+            current = math.nan if sample.current is None else sample.current
+            struct.pack_into(SLOT_FORMAT, self.memory.buf, HEADER_SIZE + (count % self.capacity) * SLOT_SIZE,
+                             sample.channel_id, sample.timestamp, sample.voltage, current)
+            count += 1
+        struct.pack_into(HEADER_FORMAT, self.memory.buf, 0, count)
+
+    def read_new(self) -> tuple[ChannelSample, ...]:
+        """Returns the samples written since the previous call."""
+        (count,) = struct.unpack_from(HEADER_FORMAT, self.memory.buf, 0)
+        start = max(self.read_count, count - self.capacity)
+        samples = []
+        for index in range(start, count):
+            channel_id, timestamp, voltage, current = struct.unpack_from(
+                SLOT_FORMAT, self.memory.buf, HEADER_SIZE + (index % self.capacity) * SLOT_SIZE)
+            samples.append(ChannelSample(channel_id, timestamp, voltage, None if math.isnan(current) else current))
+        self.read_count = count
+        return tuple(samples)
+
+    def close(self) -> None:
+        """Detaches from the shared memory, releasing it if this ring created it."""
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
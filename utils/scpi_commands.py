@@ -17,6 +17,11 @@ SET_CURR = "CURR "
 # QUERY
 ## SYSTEM
 INST_ID = "*IDN?"
+OPERATION_COMPLETE = "*OPC?"
 ## CHANNEL
 FETCH_VOLT = "FETC:VOLT?"
 FETCH_CURR = "FETC:CURR?"
+
+# COMPOUND
+COMMAND_SEPARATOR = ";:"
+RESPONSE_SEPARATOR = ";"
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from models.test_file_model import Step
+
+
+@dataclass
+class StepOrderPlan:
+    steps: list[Step]
+    relay_switches_before: int
+    relay_switches_after: int
+    load_changes_before: int
+    load_changes_after: int
+    estimated_time_saved: float
+
+    @property
+    def reordered(self) -> bool:
+        """Only a plan adding no transition and saving time is applied, any other keeps the original order."""
+        return self.estimated_time_saved > 0
+
+
+def count_transitions(steps: list[Step], initial_source: int | None, get_load: Callable[[int], float],
+                      get_settle_time: Callable[[int], float]) -> tuple[int, int, float]:
+    """
+    Counts the input source switches and the channel load changes needed to run [steps] in order, returning them
+    with the relay settle time (s) they add. Only direct current steps keep a known load on their channels.
+    """
+    relay_switches = 0
+    load_changes = 0
+    settle_time = 0.0
+    source = initial_source
+    loads: dict[int, float] = {}
+    for step in steps:
+        if step.input_source != source:
+            relay_switches += 1
+            settle_time += get_settle_time(step.input_source)
+            source = step.input_source
+        for channel_id, param_id in step.channel_params.items():
+            load = get_load(param_id) if step.step_type == 1 else None
+            if load is None or loads.get(channel_id) != load:
+                load_changes += 1
+            loads[channel_id] = load
+    return relay_switches, load_changes, settle_time
+
+
+def _load_signature(step: Step, get_load: Callable[[int], float]) -> tuple:
+    return tuple(sorted((channel_id, get_load(param_id)) for channel_id, param_id in step.channel_params.items()))
+
+
+def _reorder_segment(segment: list[Step], previous_source: int | None, next_source: int | None,
+                     get_load: Callable[[int], float]) -> list[Step]:
+    """
+    Groups the order independent [segment] by input source, starting with the source already active and ending
+    with the source of the next fixed step, and orders each group by its channel loads.
+    """
+    groups: dict[int, list[Step]] = {}
+    for step in segment:
+        groups.setdefault(step.input_source, []).append(step)
+
+    sources = list(groups.keys())
+    if next_source in groups and len(sources) > 1:
+        sources.remove(next_source)
+        sources.append(next_source)
+    if previous_source in groups:
+        sources.remove(previous_source)
+        sources.insert(0, previous_source)
+
+    ordered = []
+    for source in sources:
+        ordered.extend(sorted(groups[source], key=lambda step: _load_signature(step, get_load)))
+    return ordered
+
+
+def optimize_step_order(steps: list[Step], initial_source: int | None, get_load: Callable[[int], float],
+                        get_settle_time: Callable[[int], float], load_settle_time: float) -> StepOrderPlan:
+    """
+    Reorders each run of consecutive steps marked [order_independent] to minimize the input source relay
+    switches and the load changes. Steps not marked keep their position and bound the runs around them.
+    [get_settle_time] returns the relay settle time (s) of an input source and [load_settle_time] the settle time
+    of a load change, used to estimate the time saved.
+    """
+    ordered: list[Step] = []
+    segment: list[Step] = []
+    for step in [*steps, None]:
+        if step is not None and step.order_independent:
+            segment.append(step)
+            continue
+        if segment:
+            previous_source = ordered[-1].input_source if ordered else initial_source
+            next_source = step.input_source if step is not None else None
+            ordered.extend(_reorder_segment(segment, previous_source, next_source, get_load))
+            segment = []
+        if step is not None:
+            ordered.append(step)
+
+    switches_before, loads_before, settle_before = count_transitions(steps, initial_source, get_load,
+                                                                     get_settle_time)
+    switches_after, loads_after, settle_after = count_transitions(ordered, initial_source, get_load,
+                                                                  get_settle_time)
+    time_saved = settle_before - settle_after + (loads_before - loads_after) * load_settle_time
+    # Saving a relay switch is not worth several load changes, neither count may grow.
+    if switches_after > switches_before or loads_after > loads_before or time_saved <= 0:
+        return StepOrderPlan(list(steps), switches_before, switches_before, loads_before, loads_before, 0.0)
+    return StepOrderPlan(ordered, switches_before, switches_after, loads_before, loads_after, time_saved)
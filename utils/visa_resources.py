@@ -0,0 +1,54 @@
+from time import monotonic
+
+import pyvisa
+from pyvisa import VisaIOError
+from PySide6.QtCore import QMutex, QMutexLocker
+
+DISCOVERY_CACHE_TIME = 30.0
+
+_mutex = QMutex()
+_resource_manager: pyvisa.ResourceManager | None = None
+_discovered_resources: tuple[str, ...] = ()
+_discovery_time: float | None = None
+
+
+def get_resource_manager() -> pyvisa.ResourceManager:
+    """Returns the process-wide pyvisa-py resource manager, created on the first use."""
+    global _resource_manager
+    with QMutexLocker(_mutex):
+        if _resource_manager is None:
+            _resource_manager = pyvisa.ResourceManager("@py")
+        return _resource_manager
+
+
+def list_resources(refresh: bool = False) -> tuple[str, ...]:
+    """
+    Returns the discovered resources. The slow backend enumeration only runs when [refresh] is requested or the
+    cached result is older than [DISCOVERY_CACHE_TIME] seconds.
+    """
+    global _discovered_resources, _discovery_time
+    resource_manager = get_resource_manager()
+    with QMutexLocker(_mutex):
+        if refresh or _discovery_time is None or monotonic() - _discovery_time > DISCOVERY_CACHE_TIME:
+            _discovered_resources = tuple(resource_manager.list_resources())
+            _discovery_time = monotonic()
+        return _discovered_resources
+
+
+def open_resource(resource_path: str):
+    """
+    Opens [resource_path] directly, without enumerating the backends. Only if that fails, the (cached) discovery
+    is checked to retry once in case the path is listed under the backends, e.g. after a USB adapter was plugged
+    in. Returns None if the resource can not be opened.
+    """
+    resource_manager = get_resource_manager()
+    try:
+        return resource_manager.open_resource(resource_path)
+    except (VisaIOError, OSError, ValueError):
+        pass
+    if resource_path not in list_resources():
+        return None
+    try:
+        return resource_manager.open_resource(resource_path)
+    except (VisaIOError, OSError, ValueError):
+        return None
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from utils.sample_history import TIMESTAMP, VOLTAGE, least_squares_slope
+
+
+@dataclass(frozen=True)
+class VoltageStatistics:
+    mean: float
+    minimum: float
+    maximum: float
+    slope: float
+    samples: int
+
+    @property
+    def ripple(self) -> float:
+        """Peak-to-peak voltage of the window."""
+        return self.maximum - self.minimum
+
+    def is_inside(self, lower_limit: float, upper_limit: float, max_ripple: float = 0.0) -> bool:
+        """
+        Checks the mean of the window against the limits, so a single noisy sample does not fail the unit, and the
+        [ripple] against [max_ripple] if it is greater than 0.
+        """
+        return lower_limit <= self.mean <= upper_limit and (max_ripple <= 0 or self.ripple <= max_ripple)
+
+
+def compute_voltage_statistics(window: np.ndarray) -> VoltageStatistics | None:
+    """Returns the statistics of the voltage column of a [ChannelHistory] [window], None if it is empty."""
+    if window.shape[1] == 0:
+        return None
+    voltages = window[VOLTAGE]
+    slope = least_squares_slope(window[TIMESTAMP], voltages)
+    return VoltageStatistics(float(voltages.mean()), float(voltages.min()), float(voltages.max()), slope,
+                             window.shape[1])
+
+
+def get_stable_time(window: np.ndarray, lower_limit: float, upper_limit: float) -> float:
+    """
+    Returns for how long (s) the voltage of the [window] has been inside the limits, counted from the first sample
+    after the last one outside them up to the latest sample.
+    """
+    if window.shape[1] == 0:
+        return 0.0
+    voltages = window[VOLTAGE]
+    outside = np.flatnonzero((voltages < lower_limit) | (voltages > upper_limit))
+    if outside.size == 0:
+        first = 0
+    elif outside[-1] == window.shape[1] - 1:
+        return 0.0
+    else:
+        first = outside[-1] + 1
+    return float(window[TIMESTAMP, -1] - window[TIMESTAMP, first])
+
+
+def is_settled(window: np.ndarray, lower_limit: float, upper_limit: float, dwell_time: float,
+               slope_threshold: float) -> bool:
+    """
+    Returns True if the voltage of the [window] has been inside the limits for at least [dwell_time] (s) and its
+    slope over that dwell is below [slope_threshold] (V/s).
+    """
+    if get_stable_time(window, lower_limit, upper_limit) < dwell_time:
+        return False
+    timestamps = window[TIMESTAMP]
+    dwell = window[:, np.searchsorted(timestamps, timestamps[-1] - dwell_time, side="left"):]
+    slope = least_squares_slope(dwell[TIMESTAMP], dwell[VOLTAGE])
+    return not np.isnan(slope) and abs(slope) < slope_threshold
@@ -0,0 +1,70 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+BLOCK_SIZE = 256
+
+
+def select_channel(records: np.ndarray, channel_id: int, channel_count: int,
+                   dropped: int | None) -> np.ndarray:
+    """
+    Returns the records of [channel_id]. Every scan of the monitor records all the channels in the same order, so
+    the channel of a complete recording without [dropped] samples is a strided view of the memory map. A recording
+    that dropped samples, or whose count is still unknown, may have broken scans and is filtered instead.
+    """
+    if dropped == 0:
+        first_scan = records["channel_id"][:channel_count]
+        offsets = np.flatnonzero(first_scan == channel_id)
+        if offsets.size == 1 and len(records) % channel_count == 0 and \
+                records["channel_id"][-channel_count + offsets[0]] == channel_id:
+            return records[offsets[0]::channel_count]
+    return records[records["channel_id"] == channel_id]
+
+
+class WaveformSeries:
+    """
+    A (timestamps, values) series of a recording with the min/max of each [BLOCK_SIZE] samples computed once, so
+    the min/max decimation of a zoomed out view reads the block summaries instead of every sample.
+    Missing values (NaN) are ignored.
+    """
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray):
+        self.timestamps = timestamps
+        self.values = values
+        block_count = len(values) // BLOCK_SIZE
+        blocks = values[:block_count * BLOCK_SIZE].reshape(block_count, BLOCK_SIZE)
+        self.block_min = np.fmin.reduce(blocks, axis=1)
+        self.block_max = np.fmax.reduce(blocks, axis=1)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get_time_range(self) -> tuple[float, float]:
+        if len(self) == 0:
+            return 0.0, 0.0
+        return float(self.timestamps[0]), float(self.timestamps[-1])
+
+    def decimate(self, start: float, end: float, columns: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns (times, minimums, maximums) of the samples between [start] and [end], one entry per column when
+        there are more samples than [columns], else the samples themselves.
+        """
+        # np.searchsorted would copy the strided timestamps of the memory map, bisect only reads log(n) of them.
+        first = bisect_left(self.timestamps, start)
+        last = bisect_right(self.timestamps, end)
+        if last - first <= 2 * columns:
+            values = np.asarray(self.values[first:last], dtype=np.float64)
+            return np.asarray(self.timestamps[first:last], dtype=np.float64), values, values
+
+        edges = np.linspace(first, last, columns + 1).astype(np.int64)
+        if (last - first) // columns >= 4 * BLOCK_SIZE:
+            first_block = first // BLOCK_SIZE
+            last_block = min(-(-last // BLOCK_SIZE), len(self.block_min))
+            block_edges = edges[:-1] // BLOCK_SIZE - first_block
+            minimums = np.fmin.reduceat(self.block_min[first_block:last_block], block_edges)
+            maximums = np.fmax.reduceat(self.block_max[first_block:last_block], block_edges)
+        else:
+            values = self.values[first:last]
+            minimums = np.fmin.reduceat(values, edges[:-1] - first)
+            maximums = np.fmax.reduceat(values, edges[:-1] - first)
+        return np.asarray(self.timestamps[edges[:-1]], dtype=np.float64), minimums, maximums
@@ -1,13 +1,23 @@
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCloseEvent, QIcon
+import json
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QCloseEvent, QIcon, QFontDatabase, QShowEvent
 from PySide6.QtWidgets import QWidget, QLineEdit, QSpinBox, QVBoxLayout, QGroupBox, QLabel, QPushButton, QGridLayout, \
-    QComboBox
+    QComboBox, QHBoxLayout, QCheckBox, QDoubleSpinBox, QPlainTextEdit, QTabWidget, QFileDialog, QMessageBox, \
+    QTableWidget, QTableWidgetItem, QHeaderView
 
 from controllers.arduino_controller import ArduinoController
+from controllers.connection_pool import connection_pool
+from models.station_profile_model import StationProfile
 from utils.assets_path_util import resource_path
 from utils.config_manager import ConfigManager
 from utils.constants import *
-from utils.window_utils import center_window
+from utils.io_metrics import io_metrics
+from utils.startup_profiler import startup_profiler
+from utils.window_utils import center_window, show_custom_dialog
+
+METRICS_REFRESH_INTERVAL = 1000
+STATION_COLUMNS = ["Name", "SAT Resource", "Arduino Resource", "Arduino Port"]
 
 
 class ConfigWindow(QWidget):
@@ -15,7 +25,7 @@ class ConfigWindow(QWidget):
         super().__init__()
         self.parent_window = parent
         self.config = ConfigManager()
-        self.arduino_controller = ArduinoController()
+        self.arduino_controller: ArduinoController | None = None
         self.setWindowTitle("Settings")
         self.setFixedWidth(500)
         center_window(self)
@@ -28,15 +38,85 @@ class ConfigWindow(QWidget):
 
         # Components
         self.test_files_dir_field = QLineEdit(self.config.get(TEST_FILES_DIR))
+        self.step_order_optimization_field = QCheckBox("Reorder order independent steps")
+        self.step_order_optimization_field.setChecked(self.config.get_bool(STEP_ORDER_OPTIMIZATION))
+        self.recording_enabled_field = QCheckBox("Record the raw samples of each unit")
+        self.recording_enabled_field.setChecked(self.config.get_bool(RECORDING_ENABLED))
+        self.settling_slope_threshold_field = QDoubleSpinBox()
+        self.settling_slope_threshold_field.setRange(0, 100)
+        self.settling_slope_threshold_field.setDecimals(3)
+        self.settling_slope_threshold_field.setSuffix(" V/s")
+        self.settling_slope_threshold_field.setValue(float(self.config.get(SETTLING_SLOPE_THRESHOLD)))
+        self.settling_dwell_time_field = QSpinBox()
+        self.settling_dwell_time_field.setRange(0, 60000)
+        self.settling_dwell_time_field.setSuffix(" ms")
+        self.settling_dwell_time_field.setValue(int(self.config.get(SETTLING_DWELL_TIME)))
         self.sat_resource_path_field = QLineEdit(self.config.get(SAT_RESOURCE_PATH))
         self.arduino_resource_path_field = QLineEdit(self.config.get(ARDUINO_RESOURCE_PATH))
         self.arduino_serial_port_field = QLineEdit(self.config.get(ARDUINO_SERIAL_PORT))
         self.sat_baud_rate_field = QSpinBox()
+        self.sat_settle_time_field = QSpinBox()
+        self.sat_settle_time_field.setRange(0, 10000)
+        self.sat_settle_time_field.setSuffix(" ms")
+        self.sat_settle_time_field.setValue(int(self.config.get(SAT_SETTLE_TIME)))
+        self.sat_settle_mode_field = QComboBox()
+        self.sat_settle_mode_field.addItems(SETTLE_MODES)
+        self.sat_settle_mode_field.setCurrentText(self.config.get(SAT_SETTLE_MODE))
         self.arduino_baud_rate_field = QSpinBox()
         self.sat_baud_rate_field.setRange(0, 115200)
         self.arduino_baud_rate_field.setRange(0, 115200)
         self.sat_baud_rate_field.setValue(self.config.get(SAT_BAUD_RATE))
         self.arduino_baud_rate_field.setValue(self.config.get(ARDUINO_BAUD_RATE))
+        self.arduino_bulk_write_field = QCheckBox("Bulk pin write (WP)")
+        self.arduino_bulk_write_field.setChecked(self.config.get_bool(ARDUINO_BULK_WRITE))
+        self.arduino_break_time_field = QSpinBox()
+        self.arduino_break_time_field.setRange(0, 5000)
+        self.arduino_break_time_field.setSuffix(" ms")
+        self.arduino_break_time_field.setValue(int(self.config.get(ARDUINO_BREAK_TIME)))
+        self.relay_settle_time_fields: dict[int, QSpinBox] = {}
+        for pin, settle_time in self.config.get_relay_settle_times().items():
+            settle_time_field = QSpinBox()
+            settle_time_field.setRange(0, 10000)
+            settle_time_field.setSuffix(" ms")
+            settle_time_field.setValue(settle_time)
+            self.relay_settle_time_fields[pin] = settle_time_field
+        self.simulation_enabled_field = QCheckBox("Use simulated IT8700 and Arduino")
+        self.simulation_enabled_field.setChecked(self.config.get_bool(SIMULATION_ENABLED))
+        self.simulation_latency_field = QSpinBox()
+        self.simulation_latency_field.setRange(0, 1000)
+        self.simulation_latency_field.setSuffix(" ms")
+        self.simulation_latency_field.setValue(int(self.config.get(SIMULATION_LATENCY)))
+        self.simulation_voltage_field = QDoubleSpinBox()
+        self.simulation_voltage_field.setRange(0, 1000)
+        self.simulation_voltage_field.setSuffix(" V")
+        self.simulation_voltage_field.setValue(float(self.config.get(SIMULATION_PSU_VOLTAGE)))
+        self.simulation_current_limit_field = QDoubleSpinBox()
+        self.simulation_current_limit_field.setRange(0, 100)
+        self.simulation_current_limit_field.setSuffix(" A")
+        self.simulation_current_limit_field.setValue(float(self.config.get(SIMULATION_PSU_CURRENT_LIMIT)))
+        self.simulation_recovery_time_field = QSpinBox()
+        self.simulation_recovery_time_field.setRange(0, 10000)
+        self.simulation_recovery_time_field.setSuffix(" ms")
+        self.simulation_recovery_time_field.setValue(int(self.config.get(SIMULATION_PSU_RECOVERY_TIME)))
+        self.stations_table = QTableWidget(0, len(STATION_COLUMNS))
+        self.stations_table.setHorizontalHeaderLabels(STATION_COLUMNS)
+        self.stations_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.stations_table.verticalHeader().setVisible(False)
+        self._load_station_profiles()
+        self.station_process_isolation_field = QCheckBox("Run each station in a separate process")
+        self.station_process_isolation_field.setChecked(self.config.get_bool(STATION_PROCESS_ISOLATION))
+        self.add_station_button = QPushButton(text="Add", icon=QIcon(resource_path("assets/icons/add.svg")))
+        self.remove_station_button = QPushButton(text="Remove", icon=QIcon(resource_path("assets/icons/minus.svg")))
+        self.io_metrics_enabled_field = QCheckBox("Record I/O metrics")
+        self.io_metrics_enabled_field.setChecked(io_metrics.enabled)
+        self.io_metrics_view = QPlainTextEdit()
+        self.io_metrics_view.setReadOnly(True)
+        self.io_metrics_view.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.io_metrics_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.reset_metrics_button = QPushButton(text="Reset", icon=QIcon(resource_path("assets/icons/delete.svg")))
+        self.export_metrics_button = QPushButton(text="Export", icon=QIcon(resource_path("assets/icons/save.svg")))
+        self.metrics_refresh_timer = QTimer(self)
+        self.metrics_refresh_timer.setInterval(METRICS_REFRESH_INTERVAL)
         self.apply_changes_button = QPushButton(text="Apply", icon=QIcon(resource_path("assets/icons/check.svg")))
         self.apply_changes_button.setEnabled(False)
         self.arduino_pins_combobox = QComboBox()
@@ -45,6 +125,14 @@ class ConfigWindow(QWidget):
 
         # Signals
         self.test_files_dir_field.textChanged.connect(lambda value: self._set_changed_fields(TEST_FILES_DIR, value))
+        self.step_order_optimization_field.toggled.connect(
+            lambda value: self._set_changed_fields(STEP_ORDER_OPTIMIZATION, value))
+        self.recording_enabled_field.toggled.connect(
+            lambda value: self._set_changed_fields(RECORDING_ENABLED, value))
+        self.settling_slope_threshold_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(SETTLING_SLOPE_THRESHOLD, value))
+        self.settling_dwell_time_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(SETTLING_DWELL_TIME, value))
         self.sat_resource_path_field.textChanged.connect(
             lambda value: self._set_changed_fields(SAT_RESOURCE_PATH, value))
         self.arduino_resource_path_field.textChanged.connect(
@@ -52,8 +140,37 @@ class ConfigWindow(QWidget):
         self.arduino_serial_port_field.textChanged.connect(
             lambda value: self._set_changed_fields(ARDUINO_SERIAL_PORT, value))
         self.sat_baud_rate_field.valueChanged.connect(lambda value: self._set_changed_fields(SAT_BAUD_RATE, value))
+        self.sat_settle_time_field.valueChanged.connect(lambda value: self._set_changed_fields(SAT_SETTLE_TIME, value))
+        self.sat_settle_mode_field.currentTextChanged.connect(
+            lambda value: self._set_changed_fields(SAT_SETTLE_MODE, value))
         self.arduino_baud_rate_field.valueChanged.connect(
             lambda value: self._set_changed_fields(ARDUINO_BAUD_RATE, value))
+        self.arduino_bulk_write_field.toggled.connect(
+            lambda value: self._set_changed_fields(ARDUINO_BULK_WRITE, value))
+        self.arduino_break_time_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(ARDUINO_BREAK_TIME, value))
+        for settle_time_field in self.relay_settle_time_fields.values():
+            settle_time_field.valueChanged.connect(self._update_relay_settle_times)
+        self.simulation_enabled_field.toggled.connect(
+            lambda value: self._set_changed_fields(SIMULATION_ENABLED, value))
+        self.simulation_latency_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(SIMULATION_LATENCY, value))
+        self.simulation_voltage_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(SIMULATION_PSU_VOLTAGE, value))
+        self.simulation_current_limit_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(SIMULATION_PSU_CURRENT_LIMIT, value))
+        self.simulation_recovery_time_field.valueChanged.connect(
+            lambda value: self._set_changed_fields(SIMULATION_PSU_RECOVERY_TIME, value))
+        self.station_process_isolation_field.toggled.connect(
+            lambda value: self._set_changed_fields(STATION_PROCESS_ISOLATION, value))
+        self.stations_table.cellChanged.connect(self._update_station_profiles)
+        self.add_station_button.clicked.connect(self._add_station_profile)
+        self.remove_station_button.clicked.connect(self._remove_station_profile)
+        self.io_metrics_enabled_field.toggled.connect(
+            lambda value: self._set_changed_fields(IO_METRICS_ENABLED, value))
+        self.reset_metrics_button.clicked.connect(self._reset_io_metrics)
+        self.export_metrics_button.clicked.connect(self._export_io_metrics)
+        self.metrics_refresh_timer.timeout.connect(self._refresh_io_metrics)
         self.apply_changes_button.clicked.connect(self._apply_changes)
         self.test_pin_button.clicked.connect(self._test_arduino_pin)
 
@@ -63,16 +180,29 @@ class ConfigWindow(QWidget):
         global_config_gb = QGroupBox("Global")
         sat_config_gb = QGroupBox("SAT")
         arduino_config_gb = QGroupBox("Arduino")
+        simulation_config_gb = QGroupBox("Simulation")
 
         v_global_config_layout = QVBoxLayout(global_config_gb)
         v_global_config_layout.addWidget(QLabel("Test Files Directory:"))
         v_global_config_layout.addWidget(self.test_files_dir_field)
+        v_global_config_layout.addWidget(self.step_order_optimization_field)
+        v_global_config_layout.addWidget(self.recording_enabled_field)
+        v_global_config_layout.addWidget(QLabel("Settling Slope / Dwell:"))
+        h_settling_layout = QHBoxLayout()
+        h_settling_layout.addWidget(self.settling_slope_threshold_field)
+        h_settling_layout.addWidget(self.settling_dwell_time_field)
+        v_global_config_layout.addLayout(h_settling_layout)
 
         v_sat_config_layout = QVBoxLayout(sat_config_gb)
         v_sat_config_layout.addWidget(QLabel("Resource Path:"))
         v_sat_config_layout.addWidget(self.sat_resource_path_field)
         v_sat_config_layout.addWidget(QLabel("Baud Rate:"))
         v_sat_config_layout.addWidget(self.sat_baud_rate_field)
+        v_sat_config_layout.addWidget(QLabel("Settle Time / Mode:"))
+        h_sat_settle_layout = QHBoxLayout()
+        h_sat_settle_layout.addWidget(self.sat_settle_time_field)
+        h_sat_settle_layout.addWidget(self.sat_settle_mode_field)
+        v_sat_config_layout.addLayout(h_sat_settle_layout)
 
         g_arduino_config_layout = QGridLayout(arduino_config_gb)
         g_arduino_config_layout.addWidget(QLabel("Resource Path:"), 0, 0, 1, 6)
@@ -81,16 +211,73 @@ class ConfigWindow(QWidget):
         g_arduino_config_layout.addWidget(self.arduino_serial_port_field, 3, 0, 1, 3)
         g_arduino_config_layout.addWidget(QLabel("Baud Rate:"), 2, 3, 1, 3)
         g_arduino_config_layout.addWidget(self.arduino_baud_rate_field, 3, 3, 1, 3)
-        g_arduino_config_layout.addWidget(QLabel("Test Arduino Pins:"), 4, 0, 1, 6)
-        g_arduino_config_layout.addWidget(self.arduino_pins_combobox, 5, 0, 1, 3)
-        g_arduino_config_layout.addWidget(self.test_pin_button, 5, 3, 1, 3)
+        g_arduino_config_layout.addWidget(QLabel("Break Before Make:"), 4, 3, 1, 3)
+        g_arduino_config_layout.addWidget(self.arduino_bulk_write_field, 5, 0, 1, 3)
+        g_arduino_config_layout.addWidget(self.arduino_break_time_field, 5, 3, 1, 3)
+        g_arduino_config_layout.addWidget(QLabel("Relay Settle Time:"), 6, 0, 1, 6)
+        for index, (pin, settle_time_field) in enumerate(self.relay_settle_time_fields.items()):
+            row, column = 7 + index // 3, index % 3 * 2
+            g_arduino_config_layout.addWidget(QLabel(f"{ARDUINO_OUTPUT_PINS[pin]}:"), row, column,
+                                              Qt.AlignmentFlag.AlignRight)
+            g_arduino_config_layout.addWidget(settle_time_field, row, column + 1)
+        g_arduino_config_layout.addWidget(QLabel("Test Arduino Pins:"), 9, 0, 1, 6)
+        g_arduino_config_layout.addWidget(self.arduino_pins_combobox, 10, 0, 1, 3)
+        g_arduino_config_layout.addWidget(self.test_pin_button, 10, 3, 1, 3)
+
+        g_simulation_config_layout = QGridLayout(simulation_config_gb)
+        g_simulation_config_layout.addWidget(self.simulation_enabled_field, 0, 0, 1, 2)
+        g_simulation_config_layout.addWidget(QLabel("Serial Latency:"), 1, 0)
+        g_simulation_config_layout.addWidget(self.simulation_latency_field, 1, 1)
+        g_simulation_config_layout.addWidget(QLabel("PSU Voltage:"), 2, 0)
+        g_simulation_config_layout.addWidget(self.simulation_voltage_field, 2, 1)
+        g_simulation_config_layout.addWidget(QLabel("PSU Current Limit:"), 3, 0)
+        g_simulation_config_layout.addWidget(self.simulation_current_limit_field, 3, 1)
+        g_simulation_config_layout.addWidget(QLabel("PSU Recovery Time:"), 4, 0)
+        g_simulation_config_layout.addWidget(self.simulation_recovery_time_field, 4, 1)
+
+        settings_tab = QWidget()
+        v_settings_layout = QVBoxLayout(settings_tab)
+        v_settings_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        v_settings_layout.addWidget(global_config_gb)
+        v_settings_layout.addWidget(sat_config_gb)
+        v_settings_layout.addWidget(arduino_config_gb)
+        v_settings_layout.addWidget(simulation_config_gb)
+        v_settings_layout.addStretch(1)
+
+        stations_tab = QWidget()
+        v_stations_layout = QVBoxLayout(stations_tab)
+        v_stations_layout.addWidget(QLabel("Each station runs its own IT8700 and Arduino. Empty: SAT/Arduino settings."))
+        v_stations_layout.addWidget(self.stations_table)
+        h_stations_buttons_layout = QHBoxLayout()
+        h_stations_buttons_layout.addWidget(self.add_station_button)
+        h_stations_buttons_layout.addWidget(self.remove_station_button)
+        v_stations_layout.addLayout(h_stations_buttons_layout)
+        v_stations_layout.addWidget(self.station_process_isolation_field)
+
+        diagnostics_tab = QWidget()
+        v_diagnostics_layout = QVBoxLayout(diagnostics_tab)
+        v_diagnostics_layout.addWidget(self.io_metrics_enabled_field)
+        v_diagnostics_layout.addWidget(QLabel("Latency per command (ms):"))
+        v_diagnostics_layout.addWidget(self.io_metrics_view)
+        h_metrics_buttons_layout = QHBoxLayout()
+        h_metrics_buttons_layout.addWidget(self.reset_metrics_button)
+        h_metrics_buttons_layout.addWidget(self.export_metrics_button)
+        v_diagnostics_layout.addLayout(h_metrics_buttons_layout)
+        if startup_profiler.enabled:
+            startup_profile_view = QPlainTextEdit(startup_profiler.format_report())
+            startup_profile_view.setReadOnly(True)
+            startup_profile_view.setFont(self.io_metrics_view.font())
+            startup_profile_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+            v_diagnostics_layout.addWidget(QLabel("Startup profile:"))
+            v_diagnostics_layout.addWidget(startup_profile_view)
+
+        tabs = QTabWidget()
+        tabs.addTab(settings_tab, "Settings")
+        tabs.addTab(stations_tab, "Stations")
+        tabs.addTab(diagnostics_tab, "Diagnostics")
 
         v_main_layout = QVBoxLayout()
-        v_main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        v_main_layout.addWidget(global_config_gb)
-        v_main_layout.addWidget(sat_config_gb)
-        v_main_layout.addWidget(arduino_config_gb)
-        v_main_layout.addStretch(1)
+        v_main_layout.addWidget(tabs)
         v_main_layout.addWidget(self.apply_changes_button, alignment=Qt.AlignmentFlag.AlignRight)
 
         return v_main_layout
@@ -108,13 +295,83 @@ class ConfigWindow(QWidget):
         self.changes.update({key: value})
         self.apply_changes_button.setEnabled(True)
 
+    def _update_relay_settle_times(self) -> None:
+        settle_times = {str(pin): field.value() for pin, field in self.relay_settle_time_fields.items()}
+        self._set_changed_fields(ARDUINO_RELAY_SETTLE_TIMES, json.dumps(settle_times))
+
     def _apply_changes(self) -> None:
         for key, value in self.changes.items():
             self.config.set(key, value)
         self.apply_changes_button.setEnabled(False)
+        io_metrics.enabled = self.config.get_bool(IO_METRICS_ENABLED)
+        self._refresh_io_metrics()
+        # Pooled sessions were opened with the previous settings.
+        self.arduino_controller.close()
+        connection_pool.close_all()
+        self.arduino_controller = connection_pool.acquire_arduino()
+
+    def _load_station_profiles(self) -> None:
+        """Fills the stations table with the stored profiles only, so an empty table keeps the single station mode."""
+        profiles = [StationProfile(**profile) for profile in json.loads(self.config.get(STATION_PROFILES) or "[]")]
+        for profile in profiles:
+            self._append_station_row(profile)
+
+    def _append_station_row(self, profile: StationProfile) -> None:
+        row = self.stations_table.rowCount()
+        self.stations_table.insertRow(row)
+        values = [profile.name, profile.sat_resource_path, profile.arduino_resource_path, profile.arduino_serial_port]
+        for column, value in enumerate(values):
+            self.stations_table.setItem(row, column, QTableWidgetItem(value))
+
+    def _add_station_profile(self) -> None:
+        """Adds a station prefilled with the global instrument settings."""
+        profile = self.config.get_default_station_profile()
+        profile.name = f"Station {self.stations_table.rowCount() + 1}"
+        self.stations_table.blockSignals(True)
+        self._append_station_row(profile)
+        self.stations_table.blockSignals(False)
+        self._update_station_profiles()
+
+    def _remove_station_profile(self) -> None:
+        if self.stations_table.currentRow() < 0:
+            return
+        self.stations_table.removeRow(self.stations_table.currentRow())
+        self._update_station_profiles()
+
+    def _update_station_profiles(self) -> None:
+        profiles = []
+        for row in range(self.stations_table.rowCount()):
+            values = [self.stations_table.item(row, column).text() if self.stations_table.item(row, column) else ""
+                      for column in range(len(STATION_COLUMNS))]
+            profiles.append(StationProfile(*values))
+        self._set_changed_fields(STATION_PROFILES, ConfigManager.dump_station_profiles(profiles))
+
+    def _refresh_io_metrics(self) -> None:
+        self.io_metrics_view.setPlainText(io_metrics.format_table())
+
+    def _reset_io_metrics(self) -> None:
+        io_metrics.reset()
+        self._refresh_io_metrics()
+
+    def _export_io_metrics(self) -> None:
+        """Exports the I/O metrics to a JSON or CSV file."""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export I/O Metrics...", self.config.get(TEST_FILES_DIR),
+                                                   "JSON Files (*.json);;CSV Files (*.csv)")
+        if file_path:
+            io_metrics.export(file_path)
+            show_custom_dialog(f"Metrics exported to: {file_path}", QMessageBox.Icon.Information)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        self.arduino_controller = connection_pool.acquire_arduino()
+        self._refresh_io_metrics()
+        self.metrics_refresh_timer.start()
+        event.accept()
 
     def closeEvent(self, event: QCloseEvent) -> None:
+        self.metrics_refresh_timer.stop()
         self.arduino_controller.setup_active_pin(True)
+        connection_pool.release_arduino(self.arduino_controller)
+        self.arduino_controller = None
         self.changes.clear()
         self.parent_window.show()
         event.accept()
@@ -1,6 +1,6 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QDialog, QFormLayout, QComboBox, QLineEdit, QDialogButtonBox, QDoubleSpinBox, QGridLayout, \
-    QLabel, QWidget, QHBoxLayout, QCheckBox, QSpinBox, QPushButton
+    QLabel, QWidget, QHBoxLayout, QCheckBox, QSpinBox, QPushButton, QListWidget, QListWidgetItem
 
 
 class ChannelSetupDialog(QDialog):
@@ -261,3 +261,35 @@ class PasswordDialog(QDialog):
 
     def get_password(self) -> str:
         return self.password_input.text()
+
+
+class StationSelectionDialog(QDialog):
+    def __init__(self, station_names: list[str], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Stations")
+
+        # Components
+        self.stations_list = QListWidget()
+        for name in station_names:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.stations_list.addItem(item)
+
+        # Buttons
+        self.button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
+            self,
+        )
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+
+        # Layout
+        layout = QFormLayout(self)
+        layout.addRow(QLabel("Stations to start:"))
+        layout.addRow(self.stations_list)
+        layout.addWidget(self.button_box)
+
+    def get_selected_indexes(self) -> list[int]:
+        return [index for index in range(self.stations_list.count())
+                if self.stations_list.item(index).checkState() == Qt.CheckState.Checked]
@@ -1,21 +1,25 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-import yaml
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton, QGridLayout, QFileDialog, QMessageBox
 
-from models.test_file_model import TestData
+from models.station_profile_model import StationProfile
 from utils.assets_path_util import resource_path
 from utils.config_manager import ConfigManager
 from utils.constants import TEST_FILES_DIR
-from utils.window_utils import center_window
-from views.configs_window import ConfigWindow
-from views.create_test_window import CreateTestWindow
-from views.custom_dialogs_view import PasswordDialog
-from views.test_window import TestWindow
+from utils.window_utils import center_window, show_custom_dialog
+from views.custom_dialogs_view import PasswordDialog, StationSelectionDialog
+
+# The windows below (and yaml, pyvisa, pyserial and the controllers they pull in) are imported when their action
+# is first used, so the launcher shows up without loading them.
+if TYPE_CHECKING:
+    from models.test_file_model import TestData
+    from views.configs_window import ConfigWindow
+    from views.create_test_window import CreateTestWindow
+    from views.test_window import TestWindow
 
 
 class WindowOption(Enum):
@@ -34,9 +38,9 @@ class MainWindow(QWidget):
         self.setFixedSize(QSize(400, 400))
         center_window(self)
 
-        self.config_window = ConfigWindow(self)
-        self.create_test_window = None
-        self.test_window = None
+        self.config_window: ConfigWindow | None = None
+        self.create_test_window: CreateTestWindow | None = None
+        self.test_windows: list[TestWindow] = []
 
         # Components
         ## Logo
@@ -88,35 +92,85 @@ class MainWindow(QWidget):
             return file_path
         return None
 
+    @staticmethod
+    def _load_test_file(file_path: str) -> Optional[dict]:
+        """Returns the data of the test file at [file_path], None after showing the error if it is not valid."""
+        import yaml
+        from models.test_file_model import TestData
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                data = yaml.safe_load(file)
+            TestData(**data)
+        except (OSError, yaml.YAMLError, TypeError, ValueError) as error:
+            show_custom_dialog(f"TEST FILE : {error}", QMessageBox.Icon.Critical)
+            return None
+        return data
+
     def _show_window(self, window_option: WindowOption) -> None:
         """Configures and displays the selected window."""
         match window_option:
             case WindowOption.START:
                 file_path = self._show_file_load_dialog()
-                if file_path:
-                    with open(file_path, "r", encoding="utf-8") as file:
-                        data = yaml.safe_load(file)
-                    test_data = TestData(**data)
-                    self.hide()
-                    self.test_window = TestWindow(test_data, self)
-                    self.test_window.showMaximized()
+                data = self._load_test_file(file_path) if file_path else None
+                if data is not None:
+                    from models.test_file_model import TestData
+
+                    stations = self._select_stations()
+                    if stations:
+                        self.hide()
+                        for station in stations:
+                            self._open_test_window(TestData(**data), station)
             case WindowOption.CREATE:
                 if self._request_password():
+                    from views.create_test_window import CreateTestWindow
+
                     self.hide()
                     self.create_test_window = CreateTestWindow(self)
                     self.create_test_window.showMaximized()
             case WindowOption.EDIT:
                 if self._request_password():
                     file_path = self._show_file_load_dialog()
-                    if file_path:
+                    if file_path and self._load_test_file(file_path) is not None:
+                        from views.create_test_window import CreateTestWindow
+
                         self.hide()
                         self.create_test_window = CreateTestWindow(self, True, file_path)
                         self.create_test_window.showMaximized()
             case WindowOption.SETTINGS:
                 if self._request_password():
+                    if self.config_window is None:
+                        from views.configs_window import ConfigWindow
+
+                        self.config_window = ConfigWindow(self)
                     self.hide()
                     self.config_window.show()
 
+    def _select_stations(self) -> list[StationProfile]:
+        """Returns the station profiles to start, asking the operator when more than one is configured."""
+        profiles = self.config.get_station_profiles()
+        if len(profiles) == 1:
+            return profiles
+        dialog = StationSelectionDialog([profile.name for profile in profiles], self)
+        if dialog.exec():
+            return [profiles[index] for index in dialog.get_selected_indexes()]
+        return []
+
+    def _open_test_window(self, test_data: "TestData", station: StationProfile) -> None:
+        """Opens an independent test window, with its own instruments and sequencer, for [station]."""
+        from views.test_window import TestWindow
+
+        test_window = TestWindow(test_data, self, station)
+        test_window.closed.connect(lambda: self._on_test_window_closed(test_window))
+        self.test_windows.append(test_window)
+        test_window.showMaximized()
+
+    def _on_test_window_closed(self, test_window: "TestWindow") -> None:
+        """Shows the main window again once every station window is closed."""
+        self.test_windows.remove(test_window)
+        if not self.test_windows:
+            self.show()
+
     def _request_password(self) -> bool:
         """Compares the typed password with the pattern."""
         key = datetime.now().strftime("%d%m")
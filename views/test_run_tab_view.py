@@ -37,6 +37,7 @@ class TestRunTabView(QWidget):
         self.current_step_label = QLabel("")
         self.current_step_label.setObjectName("step_label")
         self.timer_label = QLabel("0.0s")
+        self.step_order_label = QLabel("")
         self.steps_progress_label = QLabel(f"0/{len(self.test_data.steps)}")
         self.group_label = QLabel(self.test_data.group)
         self.model_label = QLabel(self.test_data.model)
@@ -51,7 +52,8 @@ class TestRunTabView(QWidget):
         self.test_controller.state_changed.connect(self._update_status_label)
         self.test_controller.serial_number_updated.connect(self._update_serial_number_field)
         self.test_controller.current_step_changed.connect(self._set_step_info)
-        self.test_controller.delay_manager.remaining_time_changed.connect(self._update_timer)
+        self.test_controller.step_order_changed.connect(self.step_order_label.setText)
+        self.test_controller.remaining_time_changed.connect(self._update_timer)
 
         for channel_id in self.test_data.channels.keys():
             channel_monitor = ChannelMonitorView(channel_id)
@@ -157,6 +159,7 @@ class TestRunTabView(QWidget):
         f_test_info_layout = QFormLayout()
         f_test_info_layout.addRow("STATE:", self.current_state_label)
         f_test_info_layout.addRow("STEP:", self.current_step_label)
+        f_test_info_layout.addRow("ORDER:", self.step_order_label)
         v_test_info_layout.addLayout(f_test_info_layout)
         v_test_info_layout.addLayout(h_timer_progress_layout)
 
@@ -1,31 +1,46 @@
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, Signal
 from PySide6.QtGui import QCloseEvent
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QMessageBox
 
+from controllers.station_process_controller import StationProcessController
 from controllers.test_controller import TestController, TestState
+from models.station_profile_model import StationProfile
 from models.test_file_model import TestData
+from utils.config_manager import ConfigManager
+from utils.constants import STATION_PROCESS_ISOLATION
+from utils.window_utils import show_custom_dialog
 from views.result_tab_view import TestResultTabView
 from views.steps_tab_view import StepsTabView
 from views.test_run_tab_view import TestRunTabView
+from views.waveform_tab_view import WaveformTabView
 
 
 class TestWindow(QWidget):
-    def __init__(self, test_data: TestData, parent: QWidget):
+    closed = Signal()
+
+    def __init__(self, test_data: TestData, parent: QWidget, station: StationProfile | None = None):
         super().__init__()
         self.test_data = test_data
         self.parent_window = parent
-        self.test_controller = TestController(self.test_data)
+        self.station = station
+        if ConfigManager().get_bool(STATION_PROCESS_ISOLATION):
+            self.test_controller = StationProcessController(self.test_data, self.station)
+        else:
+            self.test_controller = TestController(self.test_data, self.station)
 
-        self.setWindowTitle("CEBRA IT8700")
+        self.setWindowTitle(f"CEBRA IT8700 - {self.station.name}" if self.station else "CEBRA IT8700")
 
         # Signals
         self.test_controller.state_changed.connect(self._toggle_enabled_tabs)
+        self.test_controller.instrument_error.connect(
+            lambda message: show_custom_dialog(message, QMessageBox.Icon.Critical))
 
         # Components
         self.tabs = QTabWidget()
         self.test_run_tab = TestRunTabView(self.test_data, self.test_controller)
         self.steps_tab = StepsTabView(self.test_data, self.test_controller)
         self.result_tab = TestResultTabView(self.test_controller)
+        self.waveform_tab = WaveformTabView(self.test_data, self.test_controller)
 
         self.setLayout(self._setup_layout())
 
@@ -41,6 +56,7 @@ class TestWindow(QWidget):
         self.tabs.addTab(self.test_run_tab, "RUN")
         self.tabs.addTab(self.steps_tab, "STEPS")
         self.tabs.addTab(self.result_tab, "RESULT")
+        self.tabs.addTab(self.waveform_tab, "WAVEFORM")
 
         v_main_layout = QVBoxLayout()
         v_main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -50,8 +66,6 @@ class TestWindow(QWidget):
         return v_main_layout
 
     def closeEvent(self, event: QCloseEvent) -> None:
-        if self.test_controller.monitoring_worker is not None:
-            self.test_controller.monitoring_worker.stop()
-        self.test_controller.reset_setup()
-        self.parent_window.show()
+        self.test_controller.close()
+        self.closed.emit()
         event.accept()
@@ -0,0 +1,212 @@
+import math
+
+import numpy as np
+from PySide6.QtCore import Qt, Slot, QPointF, QRectF
+from PySide6.QtGui import QPainter, QPen, QPaintEvent, QWheelEvent, QMouseEvent, QPalette
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, QLabel, QFileDialog, \
+    QMessageBox
+
+from controllers.test_controller import TestController
+from models.test_file_model import TestData
+from utils.config_manager import ConfigManager
+from utils.constants import TEST_FILES_DIR
+from utils.sample_recorder import open_recording, RECORDING_EXTENSION
+from utils.waveform_decimation import WaveformSeries, select_channel
+from utils.window_utils import show_custom_dialog
+
+PLOT_MARGINS = (60, 10, 10, 25)
+ZOOM_FACTOR = 1.25
+QUANTITIES = {"Voltage": ("voltage", "V"), "Current": ("current", "A")}
+
+
+class WaveformPlot(QWidget):
+    """
+    Plots a [WaveformSeries] as the min/max envelope of each pixel column, so only the visible range is read from the
+    recording. The wheel zooms around the cursor, dragging pans and a double click fits the whole recording.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.series: WaveformSeries | None = None
+        self.unit = ""
+        self.view_start = 0.0
+        self.view_end = 0.0
+        self.drag_x: float | None = None
+        self.setMinimumHeight(300)
+
+    def set_series(self, series: WaveformSeries | None, unit: str) -> None:
+        self.series = series
+        self.unit = unit
+        self.fit()
+
+    def fit(self) -> None:
+        if self.series is not None:
+            self.view_start, self.view_end = self.series.get_time_range()
+        self.update()
+
+    def _get_plot_rect(self) -> QRectF:
+        left, top, right, bottom = PLOT_MARGINS
+        return QRectF(left, top, max(1, self.width() - left - right), max(1, self.height() - top - bottom))
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().color(QPalette.ColorRole.Base))
+        plot_rect = self._get_plot_rect()
+        text_pen = QPen(self.palette().color(QPalette.ColorRole.Text))
+        painter.setPen(text_pen)
+        painter.drawRect(plot_rect)
+        if self.series is None or len(self.series) == 0:
+            painter.drawText(plot_rect, Qt.AlignmentFlag.AlignCenter, "No recording")
+            return
+
+        times, minimums, maximums = self.series.decimate(self.view_start, self.view_end, int(plot_rect.width()))
+        decimated = minimums is not maximums
+        valid = ~(np.isnan(minimums) | np.isnan(maximums))
+        if not valid.any():
+            painter.drawText(plot_rect, Qt.AlignmentFlag.AlignCenter, "No samples in range")
+            return
+        lower, upper = float(minimums[valid].min()), float(maximums[valid].max())
+        padding = (upper - lower) * 0.05 or max(abs(upper) * 0.01, 0.001)
+        lower, upper = lower - padding, upper + padding
+        duration = max(self.view_end - self.view_start, 1e-9)
+
+        x = plot_rect.left() + (times[valid] - self.view_start) / duration * plot_rect.width()
+        y_min = plot_rect.bottom() - (minimums[valid] - lower) / (upper - lower) * plot_rect.height()
+        y_max = plot_rect.bottom() - (maximums[valid] - lower) / (upper - lower) * plot_rect.height()
+
+        painter.setClipRect(plot_rect)
+        painter.setPen(QPen(self.palette().color(QPalette.ColorRole.Highlight), 1))
+        if decimated:
+            # The min/max envelope of the columns, drawn as one polygon so no column is left blank.
+            painter.setBrush(self.palette().color(QPalette.ColorRole.Highlight))
+            painter.drawPolygon([QPointF(*point) for point in (*zip(x, y_max), *zip(x[::-1], y_min[::-1]))])
+        else:
+            painter.drawPolyline([QPointF(*point) for point in zip(x, y_min)])
+        painter.setClipping(False)
+
+        painter.setPen(text_pen)
+        left_label_rect = QRectF(0, 0, plot_rect.left() - 4, 16)
+        painter.drawText(left_label_rect.translated(0, plot_rect.top()), Qt.AlignmentFlag.AlignRight,
+                         f"{upper:.3f} {self.unit}")
+        painter.drawText(left_label_rect.translated(0, plot_rect.bottom() - 16), Qt.AlignmentFlag.AlignRight,
+                         f"{lower:.3f} {self.unit}")
+        bottom_label_rect = QRectF(plot_rect.left(), plot_rect.bottom() + 4, plot_rect.width(), 16)
+        painter.drawText(bottom_label_rect, Qt.AlignmentFlag.AlignLeft, f"{self.view_start:.2f} s")
+        painter.drawText(bottom_label_rect, Qt.AlignmentFlag.AlignRight, f"{self.view_end:.2f} s")
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """Zooms in or out keeping the time under the cursor in place."""
+        if self.series is None:
+            return
+        plot_rect = self._get_plot_rect()
+        ratio = min(max((event.position().x() - plot_rect.left()) / plot_rect.width(), 0.0), 1.0)
+        factor = 1 / ZOOM_FACTOR if event.angleDelta().y() > 0 else ZOOM_FACTOR
+        anchor = self.view_start + ratio * (self.view_end - self.view_start)
+        self._set_view(anchor - ratio * (self.view_end - self.view_start) * factor,
+                       anchor + (1 - ratio) * (self.view_end - self.view_start) * factor)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        self.drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self.drag_x is None or self.series is None:
+            return
+        shift = (self.drag_x - event.position().x()) / self._get_plot_rect().width() * \
+            (self.view_end - self.view_start)
+        self.drag_x = event.position().x()
+        self._set_view(self.view_start + shift, self.view_end + shift)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self.drag_x = None
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        self.fit()
+
+    def _set_view(self, start: float, end: float) -> None:
+        """Sets the visible time range, kept inside the recording."""
+        first, last = self.series.get_time_range()
+        duration = min(end - start, last - first)
+        if duration <= 0 or math.isnan(duration):
+            return
+        start = min(max(start, first), last - duration)
+        self.view_start, self.view_end = start, start + duration
+        self.update()
+
+
+class WaveformTabView(QWidget):
+    """
+    Opens the sample recordings of the test through a memory map, plotting one channel at a time. The recording of
+    each finished unit is opened automatically.
+    """
+
+    def __init__(self, test_data: TestData, test_controller: TestController):
+        super().__init__()
+        self.test_data = test_data
+        self.test_controller = test_controller
+        self.config = ConfigManager()
+        self.metadata: dict = {}
+        self.records: np.ndarray | None = None
+
+        # Components
+        self.open_button = QPushButton("Open Recording...")
+        self.fit_button = QPushButton("Fit")
+        self.channel_combobox = QComboBox()
+        self.quantity_combobox = QComboBox()
+        self.quantity_combobox.addItems(QUANTITIES.keys())
+        self.info_label = QLabel("")
+        self.plot = WaveformPlot()
+
+        # Signals
+        self.open_button.clicked.connect(self._select_recording)
+        self.fit_button.clicked.connect(self.plot.fit)
+        self.channel_combobox.currentIndexChanged.connect(self._update_series)
+        self.quantity_combobox.currentIndexChanged.connect(self._update_series)
+        self.test_controller.recording_finished.connect(self.open_recording)
+
+        # Layout
+        h_toolbar_layout = QHBoxLayout()
+        h_toolbar_layout.addWidget(self.open_button)
+        h_toolbar_layout.addWidget(self.channel_combobox)
+        h_toolbar_layout.addWidget(self.quantity_combobox)
+        h_toolbar_layout.addWidget(self.fit_button)
+        layout = QVBoxLayout(self)
+        layout.addLayout(h_toolbar_layout)
+        layout.addWidget(self.info_label)
+        layout.addWidget(self.plot, 1)
+
+    @Slot()
+    def _select_recording(self) -> None:
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Open Recording...", f"{self.config.get(TEST_FILES_DIR)}/{self.test_data.group}/recordings",
+            f"Recordings (*{RECORDING_EXTENSION})")
+        if file_path:
+            self.open_recording(file_path)
+
+    @Slot(str)
+    def open_recording(self, file_path: str) -> None:
+        """Maps the recording at [file_path] and lists its channels, without reading the samples."""
+        try:
+            self.metadata, self.records = open_recording(file_path)
+        except (OSError, ValueError) as error:
+            show_custom_dialog(f"RECORDING : {error}", QMessageBox.Icon.Critical)
+            return
+
+        self.info_label.setText(f"Series Nº {self.metadata.get('serial_number', '')} - "
+                                f"{self.metadata.get('started', '')} - {len(self.records)} samples")
+        self.channel_combobox.blockSignals(True)
+        self.channel_combobox.clear()
+        for channel_id, name in self.metadata.get("channels", {}).items():
+            self.channel_combobox.addItem(f"Channel {channel_id}: {name}", int(channel_id))
+        self.channel_combobox.blockSignals(False)
+        self._update_series()
+
+    @Slot()
+    def _update_series(self) -> None:
+        channel_id = self.channel_combobox.currentData()
+        if self.records is None or channel_id is None or len(self.records) == 0:
+            self.plot.set_series(None, "")
+            return
+        field, unit = QUANTITIES[self.quantity_combobox.currentText()]
+        records = select_channel(self.records, channel_id, self.channel_combobox.count(),
+                                 self.metadata.get("dropped"))
+        self.plot.set_series(WaveformSeries(records["timestamp"], records[field]), unit)